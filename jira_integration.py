@@ -1,22 +1,69 @@
-import json
+import asyncio
+import base64
+import collections
+import dataclasses
+import logging
 import os
 import re
-from typing import Any, Dict, List
-
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import orjson
+import requests
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
-from langchain.schema import HumanMessage, SystemMessage
-from langchain_anthropic import ChatAnthropic
-from langchain_community.tools.jira.tool import JiraAction
-from langchain_google_genai import ChatGoogleGenerativeAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from parser import IssueType, JiraIssue
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Maximum issues per bulk create request; larger batches tend to time out
+MAX_BULK = 50
+
+# Patterns used for labels, dependency references and epic summaries
+_LABEL_WS = re.compile(r"\s+")
+_LABEL_INVALID = re.compile(r"[^\w\s-]+")
+_LABEL_SEPARATORS = re.compile(r"[\s-]+")
+_JIRA_KEY = re.compile(r"^[A-Z]+-\d+$")
+_BRACKET_PREFIX = re.compile(r"^\[([A-Z]+)\]\s*(.+)")
+_BRACKET_PREFIX_ONLY = re.compile(r"^\[([A-Z]+)\]")
+
+# Seconds before discovered epics are looked up again
+EPIC_CACHE_TTL = 300
+
+# Concurrent connections to Jira per batch, and requests per second allowed
+# (Jira Cloud's documented budget is 10 requests/s per user, keep some headroom)
+JIRA_CONCURRENCY = 32
+JIRA_RATE_LIMIT = 9
+
+# Seconds to stay at the reduced rate after Jira reports we are near its limit
+RATE_LIMIT_COOLDOWN = 10
+
+# Concurrent LLM enhancement calls; provider APIs warrant far fewer than Jira
+ENHANCE_CONCURRENCY = 8
+
+# LLM requests per minute when LLM_RPM is not set, and retries for calls the
+# provider rejects as rate limited
+DEFAULT_LLM_RPM = 60
+LLM_MAX_RETRIES = 3
+
+# Retry policy for throttled or failed calls
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Upper bound in seconds on any single wait, including a server's Retry-After
+MAX_RETRY_DELAY = 30
+
 
 class JiraIntegration:
-    """Integration with Jira using LangChain tools."""
+    """Integration with the Jira REST API and LangChain LLMs."""
 
     def __init__(self):
         self.jira_url = os.getenv("JIRA_URL")
@@ -29,37 +76,76 @@ class JiraIntegration:
         ):
             raise ValueError(
                 "Missing required Jira configuration. " "Please check your .env file."
-            )  # Set the environment variables that JiraAction expects
-        os.environ["JIRA_INSTANCE_URL"] = self.jira_url
-        os.environ["JIRA_CLOUD"] = "true"  # Indicate this is a cloud instance
-
-        # Initialize Jira action for creating issues
-        self.jira_action = JiraAction(
-            jira_username=self.jira_username,
-            jira_api_token=self.jira_api_token,
-            jira_instance_url=self.jira_url,
-            mode="create_issue",
-        )
+            )
 
-        # Initialize separate Jira action for getting project info
-        self.jira_project_action = JiraAction(
-            jira_username=self.jira_username,
-            jira_api_token=self.jira_api_token,
-            jira_instance_url=self.jira_url,
-            mode="get_projects",
-        )
+        # Encode credentials once; every REST helper shares these headers
+        auth_string = f"{self.jira_username}:{self.jira_api_token}"
+        auth_b64 = base64.b64encode(auth_string.encode("ascii")).decode("ascii")
+        self._auth_header = f"Basic {auth_b64}"
+        self._json_headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+        }
+
+        # Shared keep-alive session for direct REST calls
+        self._session = self._create_session()
+
+        # Issue keys in free-text Jira responses, e.g. "PROJ-123"
+        self._issue_key_re = re.compile(rf"({re.escape(self.project_key)}-\d+)")
+
+        # Request budget for the running batch; aiolimiter binds a limiter to
+        # one event loop, so acreate_issues_batch makes a new one per batch
+        self._limiter: Optional[AsyncLimiter] = None
+
+        # Monotonic time until which the limiter stays slowed down, 0 if not
+        self._slowed_until = 0.0
 
-        # Initialize LLM
+        # Epic mappings per project key, as (discovered_at, mappings)
+        self._epic_cache = {}
+
+        # Issue type name -> id, filled in by get_project_info
+        self._issue_type_ids = {}
+
+        # Create metadata per project key; it is static for the session
+        self._createmeta_cache = {}
+
+        # Initialize LLM, with a per-minute request budget; aiolimiter binds a
+        # limiter to one event loop, so each loop gets its own
         self.llm = self._initialize_llm()
+        self._llm_rpm = int(os.getenv("LLM_RPM", DEFAULT_LLM_RPM))
+        self._llm_limiters = weakref.WeakKeyDictionary()
+
+    def _create_session(self) -> requests.Session:
+        """Create a pooled, authenticated HTTP session for the Jira REST API."""
+        session = requests.Session()
+        session.headers.update(self._json_headers)
+
+        # urllib3 only retries idempotent methods by default, so issue-creating
+        # POSTs are never replayed
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _initialize_llm(self):
-        """Initialize the LLM based on the provider setting."""
+        """Initialize the LLM based on the provider setting.
+
+        Provider packages are imported here rather than at module level, so
+        importing this module doesn't load LangChain.
+        """
         provider = os.getenv("LLM_PROVIDER", "anthropic").lower()
 
         if provider == "anthropic":
             api_key = os.getenv("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not found in environment")
+            from langchain_anthropic import ChatAnthropic
+
             return ChatAnthropic(
                 model="claude-3-5-sonnet-20240620", anthropic_api_key=api_key
             )
@@ -67,12 +153,37 @@ class JiraIntegration:
             api_key = os.getenv("GOOGLE_API_KEY")
             if not api_key:
                 raise ValueError("GOOGLE_API_KEY not found in environment")
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             return ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=api_key)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
 
     def create_issue(self, issue: JiraIssue, epic_link: str = None) -> Dict[str, Any]:
         """Create a single Jira issue."""
+        issue_data = self._build_issue_data(issue, epic_link=epic_link)
+
+        try:
+            result = self._bulk_create([issue_data])[0]
+            if "key" not in result:
+                raise RuntimeError(f"Jira rejected issue: {result.get('errors')}")
+            logger.info("✅ Issue created successfully: %s", issue.title)
+            return result
+        except Exception as e:
+            logger.error("Error creating issue: %s", e)
+            # Only pay for the pretty-printed dump when someone will see it
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Issue data: %s",
+                    orjson.dumps(issue_data, option=orjson.OPT_INDENT_2).decode(),
+                )
+            # Re-raise the exception to be caught by the caller
+            raise
+
+    def _build_issue_data(
+        self, issue: JiraIssue, epic_link: str = None
+    ) -> Dict[str, Any]:
+        """Build the Jira fields payload for a single issue."""
         # Prepare the issue data
         issue_data = {
             "summary": issue.title,
@@ -82,18 +193,18 @@ class JiraIntegration:
 
         # Handle issue type - only Epic and Story are valid for this project
         if issue.issue_type == IssueType.EPIC:
-            issue_data["issuetype"] = {"name": "Epic"}
+            issue_data["issuetype"] = self._issue_type_ref("Epic")
             # Don't use customfield_10011 since it's not available in this project
             # The epic name will be included in the description instead
         else:
             # Convert all other types to Story since only Epic/Story are supported
-            issue_data["issuetype"] = {"name": "Story"}
+            issue_data["issuetype"] = self._issue_type_ref("Story")
 
         # Add priority for stories (now that you've added the field)
         try:
             issue_data["priority"] = {"name": issue.priority.value}
         except Exception as e:
-            print(f"⚠️  Could not set priority: {e}")
+            logger.warning("⚠️  Could not set priority: %s", e)
 
         # Add labels if they exist
         if issue.labels:
@@ -101,7 +212,7 @@ class JiraIntegration:
             labels_list = self._parse_labels(issue.labels)
             if labels_list:
                 issue_data["labels"] = labels_list
-                print(f"🏷️  Adding labels: {labels_list}")
+                logger.debug("🏷️  Adding labels: %s", labels_list)
 
         # Add epic link for stories
         if epic_link and issue.issue_type == IssueType.STORY:
@@ -116,11 +227,13 @@ class JiraIntegration:
                     # Custom fields usually just take the key as string
                     issue_data[epic_link_field] = epic_link
 
-                print(
-                    f"🔗 Setting epic link using field {epic_link_field}: {epic_link}"
+                logger.debug(
+                    "🔗 Setting epic link using field %s: %s",
+                    epic_link_field,
+                    epic_link,
                 )
             except Exception as e:
-                print(f"⚠️  Could not set epic link: {e}")
+                logger.warning("⚠️  Could not set epic link: %s", e)
                 # Try some common fallbacks
                 common_fields = ["parent", "customfield_10014", "customfield_10008"]
                 for field in common_fields:
@@ -129,135 +242,319 @@ class JiraIntegration:
                             issue_data[field] = {"key": epic_link}
                         else:
                             issue_data[field] = epic_link
-                        print(
-                            f"🔗 Epic link set using fallback field {field}: {epic_link}"
+                        logger.debug(
+                            "🔗 Epic link set using fallback field %s: %s",
+                            field,
+                            epic_link,
                         )
                         break
                     except Exception:
                         continue
 
-        # Create the issue using Jira action
-        fields_json = json.dumps(issue_data)
+        return issue_data
 
-        try:
-            result = self.jira_action.run(fields_json)
-            print(f"✅ Issue created successfully: {issue.title}")
-            print(f"Raw Jira response type: {type(result)}")
-            print(f"Raw Jira response: {result}")
-
-            # Return a consistent format
-            if isinstance(result, str):
-                # If it's a string, try to parse it or return a dict format
-                return {"status": "created", "message": result}
+    def _bulk_create(self, issues_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create issues through the Jira bulk endpoint, MAX_BULK per request.
+
+        Returns one entry per input payload, in submission order: the created
+        ``{"id", "key", "self"}`` dict, or ``{"status": "failed", "errors": ...}``
+        for elements Jira rejected.
+        """
+        url = f"{self.jira_url}/rest/api/2/issue/bulk"
+        results = []
+
+        for start in range(0, len(issues_data), MAX_BULK):
+            chunk = issues_data[start : start + MAX_BULK]
+            payload = {"issueUpdates": [{"fields": fields} for fields in chunk]}
+
+            response = self._session.post(url, data=orjson.dumps(payload))
+            # Jira answers 201 when every element was created and 400 when all
+            # of them failed; partial failures come back as 201 with "errors"
+            if response.status_code not in [200, 201, 400]:
+                logger.error(
+                    "⚠️  Bulk create failed: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
+                response.raise_for_status()
+
+            results.extend(
+                self._map_bulk_response(orjson.loads(response.content), len(chunk))
+            )
+
+        return results
+
+    async def _abulk_create(
+        self, session: "aiohttp.ClientSession", issues_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Async _bulk_create: all MAX_BULK chunks are posted concurrently."""
+        url = f"{self.jira_url}/rest/api/2/issue/bulk"
+        chunks = [
+            issues_data[start : start + MAX_BULK]
+            for start in range(0, len(issues_data), MAX_BULK)
+        ]
+
+        # Only replay requests Jira did not process, so nothing is created twice
+        responses = await asyncio.gather(
+            *(
+                self._apost_json(
+                    session,
+                    url,
+                    {"issueUpdates": [{"fields": fields} for fields in chunk]},
+                    retry_statuses=(429, 503),
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        # One failed chunk must not hide what the others created, so every
+        # chunk maps to per-issue results whatever happened to it
+        results = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error("⚠️  Bulk create failed: %s", response)
+                results.extend(
+                    {"status": "failed", "errors": str(response)} for _ in chunk
+                )
+                continue
+
+            status, body = response
+            if status in [200, 201, 400] and isinstance(body, dict):
+                results.extend(self._map_bulk_response(body, len(chunk)))
             else:
-                return result
-        except Exception as e:
-            print(f"Error creating issue: {e}")
-            print(f"Issue data: {json.dumps(issue_data, indent=2)}")
-            # Re-raise the exception to be caught by the caller
-            raise
+                logger.error("⚠️  Bulk create failed: %s - %s", status, body)
+                results.extend({"status": "failed", "errors": body} for _ in chunk)
+        return results
+
+    def _map_bulk_response(
+        self, data: Dict[str, Any], count: int
+    ) -> List[Dict[str, Any]]:
+        """Align a bulk create response with the submitted payloads."""
+        failed = {
+            error.get("failedElementNumber"): error for error in data.get("errors", [])
+        }
+        # "issues" only lists successful elements, in submission order
+        created = iter(data.get("issues", []))
+
+        results = []
+        for index in range(count):
+            if index in failed:
+                errors = failed[index].get("elementErrors", {})
+                logger.warning(
+                    "⚠️  Jira rejected issue #%s in batch: %s", index + 1, errors
+                )
+                results.append({"status": "failed", "errors": errors})
+            else:
+                results.append(next(created, {"status": "failed", "errors": {}}))
+        return results
 
     def create_issues_batch(self, issues: List[JiraIssue]) -> List[Dict[str, Any]]:
         """Create multiple Jira issues."""
-        results = []
+        return asyncio.run(self.acreate_issues_batch(issues))
+
+    async def aprepare_batch(self):
+        """Warm the epic and Epic Link lookups a batch needs, off the event loop.
 
-        # Discover existing epics dynamically
-        print("🔍 Discovering existing epics...")
-        epic_mappings = self._discover_epic_mappings()
+        Running this alongside LLM enhancement leaves only the issue POSTs for
+        acreate_issues_batch, which reuses both cached lookups.
+        """
+        await asyncio.to_thread(self._prepare_batch)
+
+    def _prepare_batch(self):
+        """Populate the epic mapping cache and resolve the Epic Link field."""
+        self._discover_epic_mappings()
+        self._get_epic_link_field()
+
+    async def acreate_issues_batch(
+        self, issues: List[JiraIssue]
+    ) -> List[Dict[str, Any]]:
+        """Create multiple Jira issues over one rate-limited aiohttp session."""
+        self._start_rate_limit()
+        async with self._new_async_session() as session:
+            return await self._create_issues_batch(session, issues)
+
+    async def _create_issues_batch(
+        self, session: "aiohttp.ClientSession", issues: List[JiraIssue]
+    ) -> List[Dict[str, Any]]:
+        """Create the batch's epics, then its stories, then dependency links."""
+        # Discover existing epics dynamically; the lookups use the blocking
+        # requests session, so keep them off the event loop
+        logger.info("🔍 Discovering existing epics...")
+        epic_mappings = await asyncio.to_thread(self._discover_epic_mappings)
 
         if not epic_mappings:
-            print("⚠️  No existing epics found or discovery failed")
+            logger.warning("⚠️  No existing epics found or discovery failed")
         else:
-            print(f"✅ Found {len(epic_mappings)} existing epics")
+            logger.info("✅ Found %s existing epics", len(epic_mappings))
 
-        # Store all created issues for dependency resolution
-        all_issue_mappings = epic_mappings.copy()
+        # Store all created issues for dependency resolution; new keys land in
+        # the front map while epic prefixes are read through from epic_mappings
+        all_issue_mappings = collections.ChainMap({}, epic_mappings)
 
-        # Separate epics and stories
-        epics = [issue for issue in issues if issue.issue_type == IssueType.EPIC]
-        stories = [issue for issue in issues if issue.issue_type == IssueType.STORY]
+        epics, stories, story_parents = self._split_batch(issues)
 
-        # Find all parent references in stories to identify missing epics
-        story_parents = {issue.parent for issue in stories if issue.parent}
+        # Resolve the Epic Link field up front rather than while building
+        # the first story payload
+        if stories:
+            await asyncio.to_thread(self._get_epic_link_field)
 
         # Create missing epics automatically
-        for parent in story_parents:
-            if parent not in epic_mappings:
-                # Check if this epic is already in our epics list
-                existing_epic = next(
-                    (
-                        epic
-                        for epic in epics
-                        if epic.epic_name and epic.epic_name.startswith(parent)
-                    ),
-                    None,
-                )
-                if not existing_epic:
-                    print(f"🔄 Creating placeholder epic for parent: {parent}")
-                    # Create a placeholder epic for this parent
-                    from parser import Priority
-
-                    placeholder_epic = JiraIssue(
-                        title=f"{parent} - Epic",
-                        description=f"Epic for {parent} related stories",
-                        issue_type=IssueType.EPIC,
-                        priority=Priority.MEDIUM,
-                        epic_name=f"{parent} - Epic",
-                    )
-                    epics.append(placeholder_epic)
+        epics.extend(self._placeholder_epics(epics, story_parents, epic_mappings))
 
-        # Create epics first and update mappings
-        for issue in epics:
-            result = self.create_issue(issue)
-            results.append(result)
-            # Extract the key and add to mappings
-            issue_key = self._extract_issue_key(result)
-            if issue_key:
-                # Add to all_issue_mappings for dependency resolution
-                all_issue_mappings[issue_key] = issue_key
+        results = await self._acreate_epics(
+            session, epics, epic_mappings, all_issue_mappings
+        )
 
-                if issue.epic_name:
-                    # Extract the prefix from epic name (e.g., "PREP" from "PREP - Emergency...")
-                    epic_prefix = (
-                        issue.epic_name.split(" - ")[0]
-                        if " - " in issue.epic_name
-                        else issue.epic_name.split()[0]  # fallback to first word
-                    )
-                    epic_mappings[epic_prefix] = issue_key
-                    all_issue_mappings[epic_prefix] = issue_key
-                    print(f"🔗 Epic mapping updated: {epic_prefix} -> {issue_key}")
+        # New epics exist now, so later batches must not reuse the old lookup
+        if epics:
+            self.invalidate_epic_cache()
+
+        story_results, story_keys = await self._acreate_stories(
+            session, stories, epic_mappings, all_issue_mappings
+        )
+        results.extend(story_results)
+
+        # All links for the run go out concurrently instead of one POST at a time
+        await self._create_issue_links(
+            session, self._dependency_links(stories, story_keys, all_issue_mappings)
+        )
+
+        return results
+
+    @staticmethod
+    def _split_batch(
+        issues: List[JiraIssue],
+    ) -> Tuple[List[JiraIssue], List[JiraIssue], set]:
+        """Separate epics and stories, collecting the parents stories reference."""
+        epics, stories, story_parents = [], [], set()
+        epic_type = IssueType.EPIC
+        for issue in issues:
+            if issue.issue_type is epic_type:
+                epics.append(issue)
+            else:
+                # Tasks are created as stories, the only other supported type
+                stories.append(issue)
+                if issue.parent:
+                    story_parents.add(issue.parent)
+        return epics, stories, story_parents
+
+    def _placeholder_epics(
+        self,
+        epics: List[JiraIssue],
+        story_parents: set,
+        epic_mappings: Dict[str, str],
+    ) -> List[JiraIssue]:
+        """Epics to create for story parents neither in Jira nor in the batch."""
+        from parser import Priority
+
+        # Index the batch's epics by prefix once instead of scanning per parent
+        epic_prefixes = {
+            self._epic_prefix(epic.epic_name) for epic in epics if epic.epic_name
+        }
 
-        # Create stories and link them to epics
+        placeholders = []
+        for parent in story_parents:
+            if parent in epic_mappings or parent in epic_prefixes:
+                continue
+            logger.info("🔄 Creating placeholder epic for parent: %s", parent)
+            placeholders.append(
+                JiraIssue(
+                    title=f"{parent} - Epic",
+                    description=f"Epic for {parent} related stories",
+                    issue_type=IssueType.EPIC,
+                    priority=Priority.MEDIUM,
+                    epic_name=f"{parent} - Epic",
+                )
+            )
+        return placeholders
+
+    async def _acreate_epics(
+        self,
+        session: "aiohttp.ClientSession",
+        epics: List[JiraIssue],
+        epic_mappings: Dict[str, str],
+        all_issue_mappings: collections.ChainMap,
+    ) -> List[Dict[str, Any]]:
+        """Create epics (one bulk request per MAX_BULK) and record their keys."""
+        epic_results = await self._abulk_create(
+            session, [self._build_issue_data(issue) for issue in epics]
+        )
+        for issue, result in zip(epics, epic_results):
+            issue_key = self._extract_issue_key(result)
+            if not issue_key:
+                continue
+            logger.info("✅ Issue created successfully: %s", issue.title)
+            # Add to all_issue_mappings for dependency resolution
+            all_issue_mappings[issue_key] = issue_key
+
+            if issue.epic_name:
+                epic_prefix = self._epic_prefix(issue.epic_name)
+                epic_mappings[epic_prefix] = issue_key
+                logger.debug(
+                    "🔗 Epic mapping updated: %s -> %s", epic_prefix, issue_key
+                )
+        return list(epic_results)
+
+    async def _acreate_stories(
+        self,
+        session: "aiohttp.ClientSession",
+        stories: List[JiraIssue],
+        epic_mappings: Dict[str, str],
+        all_issue_mappings: collections.ChainMap,
+    ) -> Tuple[List[Dict[str, Any]], List[Optional[str]]]:
+        """Create stories linked to their epics; returns results and new keys."""
+        story_data = []
         for issue in stories:
             epic_link = None
             if issue.parent and issue.parent in epic_mappings:
                 epic_link = epic_mappings[issue.parent]
-                print(f"🔗 Linking story '{issue.title}' to epic {epic_link}")
+                logger.debug("🔗 Linking story '%s' to epic %s", issue.title, epic_link)
             elif issue.parent:
-                print(
-                    f"⚠️  Epic '{issue.parent}' not found in mappings: {list(epic_mappings.keys())}"
+                logger.warning(
+                    "⚠️  Epic '%s' not found in mappings: %s",
+                    issue.parent,
+                    list(epic_mappings.keys()),
                 )
+            story_data.append(self._build_issue_data(issue, epic_link=epic_link))
 
-            result = self.create_issue(issue, epic_link=epic_link)
-            results.append(result)
-
+        story_results = await self._abulk_create(session, story_data)
+        story_keys = []
+        for issue, result in zip(stories, story_results):
             # Add story to all_issue_mappings for dependency resolution
             issue_key = self._extract_issue_key(result)
+            story_keys.append(issue_key)
             if issue_key:
+                logger.info("✅ Issue created successfully: %s", issue.title)
                 all_issue_mappings[issue_key] = issue_key
                 # Also add by title for easier lookup
                 all_issue_mappings[issue.title] = issue_key
-
-            # Create dependency links if this issue has dependencies
+        return list(story_results), story_keys
+
+    def _dependency_links(
+        self,
+        stories: List[JiraIssue],
+        story_keys: List[Optional[str]],
+        all_issue_mappings: collections.ChainMap,
+    ) -> List[Tuple[str, str]]:
+        """(story key, dependency key) pairs, once every story has a key."""
+        links = []
+        by_prefix = self._index_titles_by_prefix(all_issue_mappings)
+        for issue, issue_key in zip(stories, story_keys):
             if issue.dependencies and issue_key:
                 dependencies = self._parse_dependencies(issue.dependencies)
                 resolved_deps = self._resolve_dependency_keys(
-                    dependencies, all_issue_mappings
+                    dependencies, all_issue_mappings, by_prefix
                 )
-                if resolved_deps:
-                    self._create_issue_links(issue_key, resolved_deps)
+                links.extend((issue_key, dep_key) for dep_key in resolved_deps)
+        return links
 
-        return results
+    def _epic_prefix(self, epic_name: str) -> str:
+        """Extract the prefix from epic name (e.g., "PREP" from "PREP - Emergency...")."""
+        if " - " in epic_name:
+            return epic_name.split(" - ", 1)[0]
+        words = epic_name.split()
+        return words[0] if words else epic_name  # fallback to first word
 
     def _extract_issue_key(self, result) -> str:
         """Extract issue key from Jira API response."""
@@ -265,9 +562,7 @@ class JiraIntegration:
             return result.get("key")
         elif isinstance(result, str):
             # Try to extract key from string response
-            import re
-
-            match = re.search(r"(GMLT-\d+)", result)
+            match = self._issue_key_re.search(result)
             return match.group(1) if match else None
         return None
 
@@ -277,15 +572,13 @@ class JiraIntegration:
             return []
 
         # Split by common separators and clean up
-        import re
-
         # If there are commas, split by comma (most common case)
         if "," in labels_string:
             labels = [label.strip() for label in labels_string.split(",")]
         else:
             # For space-separated labels, be smarter about multi-word labels
             # Split by spaces but treat hyphenated words as single labels
-            labels = re.split(r"\s+", labels_string.strip())
+            labels = _LABEL_WS.split(labels_string.strip())
 
         # Clean up labels: remove empty strings, convert to valid format
         valid_labels = []
@@ -293,13 +586,10 @@ class JiraIntegration:
             label = label.strip()
             if label:
                 # Jira labels cannot contain spaces, but can contain hyphens and underscores
-                # Replace spaces with hyphens and remove other invalid chars
-                clean_label = re.sub(r"\s+", "-", label)  # Replace spaces with hyphens
-                clean_label = re.sub(
-                    r"[^\w-]", "", clean_label
-                )  # Keep only word chars and hyphens
-                clean_label = re.sub(r"-+", "-", clean_label)  # Remove multiple hyphens
-                clean_label = clean_label.strip("-")  # Remove leading/trailing hyphens
+                # Drop invalid chars, then turn each run of spaces/hyphens into
+                # one hyphen and trim hyphens from the ends
+                clean_label = _LABEL_INVALID.sub("", label)
+                clean_label = _LABEL_SEPARATORS.sub("-", clean_label).strip("-")
                 if clean_label:
                     valid_labels.append(clean_label)
 
@@ -318,19 +608,26 @@ class JiraIntegration:
         description_parts.append(issue.description)
 
         if issue.business_outcome:
-            description_parts.append(
-                f"\n**Business Outcome:** {issue.business_outcome}"
-            )
+            description_parts.append("")
+            description_parts.append(f"**Business Outcome:** {issue.business_outcome}")
 
         if issue.acceptance_criteria:
-            description_parts.append("\n**Acceptance Criteria:**")
-            for i, criteria in enumerate(issue.acceptance_criteria, 1):
-                description_parts.append(f"{i}. {criteria.description}")
+            description_parts.append("")
+            description_parts.append("**Acceptance Criteria:**")
+            # Numbered list as a single chunk
+            description_parts.append(
+                "\n".join(
+                    f"{i}. {criteria.description}"
+                    for i, criteria in enumerate(issue.acceptance_criteria, 1)
+                )
+            )
 
         return "\n".join(description_parts)
 
-    def enhance_with_llm(self, issue: JiraIssue) -> JiraIssue:
-        """Use LLM to enhance the issue description and details."""
+    def _enhancement_messages(self, issue: JiraIssue) -> List[Any]:
+        """Build the prompt used to enhance a single issue."""
+        from langchain.schema import HumanMessage, SystemMessage
+
         system_message = SystemMessage(
             content="""
         You are an expert at writing Jira tickets. Given a basic issue description,
@@ -358,36 +655,106 @@ class JiraIntegration:
         """
         )
 
-        try:
-            response = self.llm.invoke([system_message, human_message])
+        return [system_message, human_message]
 
-            # Parse the LLM response and use it to enhance the description
-            enhanced_description = (
-                f"{issue.description}\n\n--- AI Enhanced ---\n{response.content}"
-            )
+    def _apply_enhancement(self, issue: JiraIssue, content: str) -> JiraIssue:
+        """Return a copy of the issue with the LLM output appended."""
+        # Parse the LLM response and use it to enhance the description
+        enhanced_description = f"{issue.description}\n\n--- AI Enhanced ---\n{content}"
+        return dataclasses.replace(issue, description=enhanced_description)
 
-            return JiraIssue(
-                title=issue.title,
-                description=enhanced_description,
-                issue_type=issue.issue_type,
-                priority=issue.priority,
-                story_key=issue.story_key,
-                acceptance_criteria=issue.acceptance_criteria,
-                business_outcome=issue.business_outcome,
-                epic_name=issue.epic_name,
-            )
+    def enhance_with_llm(self, issue: JiraIssue) -> JiraIssue:
+        """Use LLM to enhance the issue description and details."""
+        try:
+            response = self.llm.invoke(self._enhancement_messages(issue))
+            return self._apply_enhancement(issue, response.content)
         except Exception as e:
-            print(f"Warning: Could not enhance issue with LLM: {e}")
+            logger.warning("Warning: Could not enhance issue with LLM: %s", e)
             return issue
 
+    async def aenhance_with_llm(self, issue: JiraIssue) -> JiraIssue:
+        """Async enhance_with_llm, using the provider's native async client.
+
+        Calls are paced by the LLM_RPM budget and retried with backoff when the
+        provider still answers with a rate-limit error.
+        """
+        messages = self._enhancement_messages(issue)
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                async with self._current_llm_limiter():
+                    response = await self.llm.ainvoke(messages)
+                return self._apply_enhancement(issue, response.content)
+            except Exception as e:
+                if self._is_rate_limited(e) and attempt < LLM_MAX_RETRIES:
+                    await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+                    continue
+                logger.warning("Warning: Could not enhance issue with LLM: %s", e)
+                return issue
+
+    def _current_llm_limiter(self) -> AsyncLimiter:
+        """The LLM_RPM budget for the running event loop."""
+        loop = asyncio.get_running_loop()
+        limiter = self._llm_limiters.get(loop)
+        if limiter is None:
+            limiter = self._llm_limiters[loop] = AsyncLimiter(self._llm_rpm, 60)
+        return limiter
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Whether an LLM client error is an HTTP 429 from the provider."""
+        # Anthropic errors carry status_code, Google API errors carry code
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        return status == 429
+
+    async def enhance_many(
+        self, issues: List[JiraIssue], concurrency: int = ENHANCE_CONCURRENCY
+    ) -> List[JiraIssue]:
+        """Enhance issues concurrently, at most ``concurrency`` LLM calls at a time.
+
+        Results keep the input order; any issue that fails comes back unchanged.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        enhanced = await asyncio.gather(
+            *(self._aenhance_guard(semaphore, issue) for issue in issues),
+            return_exceptions=True,
+        )
+        return [
+            issue if isinstance(result, BaseException) else result
+            for issue, result in zip(issues, enhanced)
+        ]
+
+    async def _aenhance_guard(
+        self, semaphore: asyncio.Semaphore, issue: JiraIssue
+    ) -> JiraIssue:
+        """Enhance one issue once a concurrency slot is free."""
+        async with semaphore:
+            return await self.aenhance_with_llm(issue)
+
     def get_project_info(self) -> Dict[str, Any]:
-        """Get information about the Jira project."""
-        return self.jira_project_action.run(self.project_key)
+        """Get information about the Jira project and remember its issue types."""
+        url = f"{self.jira_url}/rest/api/2/project/{self.project_key}"
+        response = self._session.get(url)
+        response.raise_for_status()
+        project_info = orjson.loads(response.content)
+        self.remember_issue_types(project_info.get("issueTypes", []))
+        return project_info
+
+    def remember_issue_types(self, issue_types: List[Dict[str, Any]]):
+        """Record issue type ids so new issues reference their type by id."""
+        self._issue_type_ids = {
+            issue_type["name"]: issue_type["id"]
+            for issue_type in issue_types
+            if "name" in issue_type and "id" in issue_type
+        }
+
+    def _issue_type_ref(self, name: str) -> Dict[str, str]:
+        """Reference an issue type by id when known, otherwise by name."""
+        issue_type_id = self._issue_type_ids.get(name)
+        return {"id": issue_type_id} if issue_type_id else {"name": name}
 
     def list_issue_types(self) -> List[Dict[str, Any]]:
         """List available issue types in the project."""
-        instruction = "List all available issue types in the project"
-        return self.jira_action.run(instruction)
+        return self.get_project_info().get("issueTypes", [])
 
     def _get_epic_link_field(self) -> str:
         """Discover the Epic Link field for this Jira project."""
@@ -395,19 +762,6 @@ class JiraIntegration:
             return self._epic_link_field
 
         try:
-            # Initialize a Jira action for getting field info
-            field_action = JiraAction(
-                jira_username=self.jira_username,
-                jira_api_token=self.jira_api_token,
-                jira_instance_url=self.jira_url,
-                mode="get_projects",
-            )
-
-            # Get project metadata to find epic link field
-            project_info = field_action.run(self.project_key)
-            print(f"🔍 Project info type: {type(project_info)}")
-            print(f"🔍 Project info: {project_info}")
-
             # Try to discover the Epic Link field from project metadata
             discovered_field = self._get_project_fields()
             if discovered_field and isinstance(discovered_field, str):
@@ -416,89 +770,116 @@ class JiraIntegration:
                 # Fall back to most common field
                 self._epic_link_field = "customfield_10014"
 
-            print(f"🔗 Using Epic Link field: {self._epic_link_field}")
+            logger.info("🔗 Using Epic Link field: %s", self._epic_link_field)
             return self._epic_link_field
 
         except Exception as e:
-            print(f"⚠️  Could not determine Epic Link field: {e}")
+            logger.warning("⚠️  Could not determine Epic Link field: %s", e)
             # Fall back to most common field
             self._epic_link_field = "customfield_10014"
             return self._epic_link_field
 
+    def _fetch_createmeta(self, project_key: str) -> Dict[str, Any]:
+        """Fetch project create metadata; it is static for the session, so cached."""
+        cached = self._createmeta_cache.get(project_key)
+        if cached is not None:
+            return cached
+
+        url = f"{self.jira_url}/rest/api/2/issue/createmeta"
+        # Only the Story schema is inspected, so don't download every issue type
+        params = {
+            "projectKeys": project_key,
+            "issuetypeNames": "Story",
+            "expand": "projects.issuetypes.fields",
+        }
+
+        response = self._session.get(url, params=params)
+        response.raise_for_status()
+        # createmeta is by far the largest payload we parse
+        metadata = orjson.loads(response.content)
+        self._createmeta_cache[project_key] = metadata
+        return metadata
+
     def _get_project_fields(self) -> Dict[str, Any]:
         """Get all available fields for this Jira project."""
         try:
-            # Use the Jira REST API directly to get field information
-            import base64
+            # Get project create metadata to find available fields
+            metadata = self._fetch_createmeta(self.project_key)
+            logger.debug("🔍 Create metadata retrieved successfully")
+
+            # Look for Epic Link field in the metadata; only one project and
+            # one Story issue type can match, so stop at the first of each
+            project = next(
+                (
+                    project
+                    for project in metadata.get("projects", [])
+                    if project.get("key") == self.project_key
+                ),
+                {},
+            )
+            story_type = next(
+                (
+                    issue_type
+                    for issue_type in project.get("issuetypes", [])
+                    if issue_type.get("name") == "Story"
+                ),
+                None,
+            )
+            if story_type:
+                field_id = self._find_epic_link_field(story_type.get("fields", {}))
+                if field_id:
+                    return field_id
 
-            import requests
+            return metadata
 
-            # Prepare authentication
-            auth_string = f"{self.jira_username}:{self.jira_api_token}"
-            auth_bytes = auth_string.encode("ascii")
-            auth_b64 = base64.b64encode(auth_bytes).decode("ascii")
+        except requests.HTTPError as e:
+            logger.warning(
+                "⚠️  Failed to get create metadata: %s", e.response.status_code
+            )
+            return None
+        except Exception as e:
+            logger.warning("⚠️  Error getting project fields: %s", e)
+            return None
 
-            headers = {
-                "Authorization": f"Basic {auth_b64}",
-                "Content-Type": "application/json",
-            }
+    def _find_epic_link_field(self, fields: Dict[str, Any]) -> Optional[str]:
+        """Pick the field stories use to reference their epic, in a single pass.
 
-            # Get project create metadata to find available fields
-            url = f"{self.jira_url}/rest/api/2/issue/createmeta"
-            params = {
-                "projectKeys": self.project_key,
-                "expand": "projects.issuetypes.fields",
-            }
+        A field named like "Epic Link" wins outright; otherwise ``parent``;
+        otherwise the first custom field with "epic" in its name.
+        """
+        best = None
+        best_priority = -1
+
+        for field_id, field_info in fields.items():
+            field_name = field_info.get("name", "").lower()
+            if "epic" in field_name and "link" in field_name:
+                logger.debug(
+                    "🔗 Found Epic Link field: %s (%s)",
+                    field_id,
+                    field_info.get("name"),
+                )
+                return field_id
 
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                metadata = response.json()
-                print("🔍 Create metadata retrieved successfully")
-
-                # Look for Epic Link field in the metadata
-                for project in metadata.get("projects", []):
-                    if project.get("key") == self.project_key:
-                        for issue_type in project.get("issuetypes", []):
-                            if issue_type.get("name") == "Story":
-                                fields = issue_type.get("fields", {})
-
-                                # Check for Epic Link field by name
-                                for field_id, field_info in fields.items():
-                                    field_name = field_info.get("name", "").lower()
-                                    if "epic" in field_name and "link" in field_name:
-                                        print(
-                                            f"🔗 Found Epic Link field: {field_id} ({field_info.get('name')})"
-                                        )
-                                        return field_id
-
-                                # Check for Parent field (which might be used for Epic links)
-                                if "parent" in fields:
-                                    parent_field = fields["parent"]
-                                    parent_name = parent_field.get("name", "")
-                                    print(
-                                        f"🔗 Found Parent field: parent ({parent_name})"
-                                    )
-                                    # In some Jira setups, Parent field is used for Epic links
-                                    return "parent"
-
-                                # Check for custom fields that might be Epic Link
-                                for field_id, field_info in fields.items():
-                                    if field_id.startswith("customfield_"):
-                                        field_name = field_info.get("name", "").lower()
-                                        if "epic" in field_name:
-                                            print(
-                                                f"🔗 Found Epic-related field: {field_id} ({field_info.get('name')})"
-                                            )
-                                            return field_id
-
-                return metadata
+            if field_id == "parent":
+                priority = 1
+            elif field_id.startswith("customfield_") and "epic" in field_name:
+                priority = 0
             else:
-                print(f"⚠️  Failed to get create metadata: {response.status_code}")
-                return None
+                continue
 
-        except Exception as e:
-            print(f"⚠️  Error getting project fields: {e}")
-            return None
+            if priority > best_priority:
+                best, best_priority = field_id, priority
+
+        if best == "parent":
+            # In some Jira setups, Parent field is used for Epic links
+            logger.debug(
+                "🔗 Found Parent field: parent (%s)", fields["parent"].get("name", "")
+            )
+        elif best:
+            logger.debug(
+                "🔗 Found Epic-related field: %s (%s)", best, fields[best].get("name")
+            )
+        return best
 
     def _parse_dependencies(self, dependencies_string: str) -> List[str]:
         """Parse dependencies string to extract individual dependency references."""
@@ -519,7 +900,7 @@ class JiraIntegration:
                 continue
 
             # Check if it's already a Jira key (e.g., GMLT-123)
-            if re.match(r"^[A-Z]+-\d+$", part):
+            if _JIRA_KEY.match(part):
                 dependencies.append(part)
             else:
                 # Extract reference from format like "[PREP] Emergency Bed Bug Supply Purchase"
@@ -528,15 +909,39 @@ class JiraIntegration:
 
         return dependencies
 
+    def _index_titles_by_prefix(
+        self, issue_mappings: Dict[str, str]
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """Group mapped titles by bracket prefix, e.g. "[PREP] Task" under "PREP".
+
+        Values are ``(lowercased_title, key)`` pairs in mapping order.
+        """
+        by_prefix = collections.defaultdict(list)
+        for title, key in issue_mappings.items():
+            prefix_match = _BRACKET_PREFIX_ONLY.match(title)
+            if prefix_match:
+                by_prefix[prefix_match.group(1)].append((title.lower(), key))
+        return by_prefix
+
     def _resolve_dependency_keys(
-        self, dependencies: List[str], issue_mappings: Dict[str, str]
+        self,
+        dependencies: List[str],
+        issue_mappings: Dict[str, str],
+        by_prefix: Optional[Dict[str, List[Tuple[str, str]]]] = None,
     ) -> List[str]:
-        """Resolve dependency references to actual Jira issue keys."""
+        """Resolve dependency references to actual Jira issue keys.
+
+        ``by_prefix`` is the index from _index_titles_by_prefix; pass it when
+        resolving many issues against the same mappings so it is built once.
+        """
+        if by_prefix is None:
+            by_prefix = self._index_titles_by_prefix(issue_mappings)
+
         resolved_keys = []
 
         for dep in dependencies:
             # If it's already a Jira key, use it directly
-            if re.match(r"^[A-Z]+-\d+$", dep):
+            if _JIRA_KEY.match(dep):
                 resolved_keys.append(dep)
                 continue
 
@@ -546,7 +951,7 @@ class JiraIntegration:
 
             # Try to match against our issue mappings
             # Look for patterns like "[PREP] Emergency Bed Bug Supply Purchase"
-            bracket_match = re.match(r"^\[([A-Z]+)\]\s*(.+)", dep)
+            bracket_match = _BRACKET_PREFIX.match(dep)
             if bracket_match:
                 epic_prefix = bracket_match.group(1)
                 task_name = bracket_match.group(2).strip()
@@ -554,20 +959,22 @@ class JiraIntegration:
                 # First, try to find an exact match by task name
                 if task_name in issue_mappings:
                     resolved_keys.append(issue_mappings[task_name])
-                    print(
-                        f"🔗 Resolved dependency '{dep}' to specific story {issue_mappings[task_name]}"
+                    logger.debug(
+                        "🔗 Resolved dependency '%s' to specific story %s",
+                        dep,
+                        issue_mappings[task_name],
                     )
                     continue
 
                 # If no exact match, try to find by epic prefix and partial title match
-                for title, key in issue_mappings.items():
-                    if (
-                        title.startswith(f"[{epic_prefix}]")
-                        and task_name.lower() in title.lower()
-                    ):
+                task_name_lower = task_name.lower()
+                for title_lower, key in by_prefix.get(epic_prefix, ()):
+                    if task_name_lower in title_lower:
                         resolved_keys.append(key)
-                        print(
-                            f"🔗 Resolved dependency '{dep}' to story {key} (partial match)"
+                        logger.debug(
+                            "🔗 Resolved dependency '%s' to story %s (partial match)",
+                            dep,
+                            key,
                         )
                         break
                 else:
@@ -575,86 +982,185 @@ class JiraIntegration:
                     if epic_prefix in issue_mappings:
                         epic_key = issue_mappings[epic_prefix]
                         resolved_keys.append(epic_key)
-                        print(
-                            f"🔗 Resolved dependency '{dep}' to epic {epic_key} (fallback)"
+                        logger.debug(
+                            "🔗 Resolved dependency '%s' to epic %s (fallback)",
+                            dep,
+                            epic_key,
                         )
                     else:
-                        print(f"⚠️  Could not resolve dependency: {dep}")
+                        logger.warning("⚠️  Could not resolve dependency: %s", dep)
             else:
                 # Try direct lookup by title
                 if dep in issue_mappings:
                     resolved_keys.append(issue_mappings[dep])
-                    print(f"🔗 Resolved dependency '{dep}' to {issue_mappings[dep]}")
+                    logger.debug(
+                        "🔗 Resolved dependency '%s' to %s", dep, issue_mappings[dep]
+                    )
                 else:
-                    print(f"⚠️  Could not parse dependency format: {dep}")
+                    logger.warning("⚠️  Could not parse dependency format: %s", dep)
 
         return resolved_keys
 
-    def _create_issue_links(self, issue_key: str, dependency_keys: List[str]):
-        """Create issue links for dependencies (blocked by relationships)."""
-        if not dependency_keys:
+    async def _create_issue_links(
+        self, session: "aiohttp.ClientSession", links: List[Tuple[str, str]]
+    ):
+        """Create issue links for dependencies (blocked by relationships).
+
+        ``links`` holds ``(issue_key, dependency_key)`` pairs; all of them are
+        posted concurrently, bounded by the session's connection pool and the
+        rate limiter.
+        """
+        if not links:
             return
 
-        try:
-            # Use direct Jira API to create issue links
-            import base64
+        outcomes = await asyncio.gather(
+            *(
+                self._post_issue_link(session, issue_key, dep_key)
+                for issue_key, dep_key in links
+            ),
+            return_exceptions=True,
+        )
 
-            import requests
+        for (issue_key, dep_key), outcome in zip(links, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "⚠️  Error creating issue link %s -> %s: %s",
+                    dep_key,
+                    issue_key,
+                    outcome,
+                )
 
-            # Prepare authentication
-            auth_string = f"{self.jira_username}:{self.jira_api_token}"
-            auth_bytes = auth_string.encode("ascii")
-            auth_b64 = base64.b64encode(auth_bytes).decode("ascii")
+    async def _post_issue_link(
+        self, session: "aiohttp.ClientSession", issue_key: str, dep_key: str
+    ):
+        """Post a single "Blocks" link between two issues."""
+        link_data = {
+            "type": {
+                "name": "Blocks"  # Common link type meaning dep_key blocks issue_key
+            },
+            "inwardIssue": {"key": issue_key},  # This issue is blocked by
+            "outwardIssue": {"key": dep_key},  # This dependency blocks the issue
+        }
 
-            headers = {
-                "Authorization": f"Basic {auth_b64}",
-                "Content-Type": "application/json",
-            }
+        url = f"{self.jira_url}/rest/api/2/issueLink"
+        status, body = await self._apost_json(session, url, link_data)
 
-            # Create issue links for each dependency
-            for dep_key in dependency_keys:
-                # Create a "Blocks" link (dependency blocks this issue)
-                link_data = {
-                    "type": {
-                        "name": "Blocks"  # Common link type meaning dep_key blocks issue_key
-                    },
-                    "inwardIssue": {"key": issue_key},  # This issue is blocked by
-                    "outwardIssue": {
-                        "key": dep_key  # This dependency blocks the issue
-                    },
-                }
-
-                url = f"{self.jira_url}/rest/api/2/issueLink"
-                response = requests.post(url, headers=headers, json=link_data)
-
-                if response.status_code in [200, 201]:
-                    print(f"🔗 Created dependency link: {dep_key} blocks {issue_key}")
-                else:
-                    print(
-                        f"⚠️  Failed to create dependency link: {response.status_code} - {response.text}"
-                    )
+        if status in [200, 201]:
+            logger.info("🔗 Created dependency link: %s blocks %s", dep_key, issue_key)
+        else:
+            logger.warning("⚠️  Failed to create dependency link: %s - %s", status, body)
+
+    async def _apost_json(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        payload: Dict[str, Any],
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ) -> Tuple[Optional[int], Any]:
+        """POST JSON under the rate limiter, backing off on throttled responses.
+
+        Waits for the server's ``Retry-After`` when given, otherwise backs off
+        exponentially. Returns ``(status, body)``; body is the decoded JSON, or the raw text
+        when the response is not JSON. A transport failure returns
+        ``(None, message)`` instead of raising.
+        """
+        data = orjson.dumps(payload)
 
-        except Exception as e:
-            print(f"⚠️  Error creating issue links: {e}")
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with self._limiter:
+                    async with session.post(url, data=data) as response:
+                        status = response.status
+                        headers = response.headers
+                        self._adapt_rate_limit(headers)
+                        raw = await response.read()
+            except aiohttp.ClientConnectorError as e:
+                # The connection was never made, so nothing reached Jira and
+                # the request is safe to replay like a 429/503
+                if attempt == MAX_RETRIES - 1:
+                    return None, f"Could not connect to Jira: {e}"
+                delay = self._retry_delay(None, attempt)
+                logger.debug("⏳ Could not connect to Jira, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Jira may already have processed the request, and replaying a
+                # create could duplicate issues, so report it as failed
+                return None, f"{type(e).__name__}: {e}"
+
+            if status not in retry_statuses or attempt == MAX_RETRIES - 1:
+                break
+            delay = self._retry_delay(headers.get("Retry-After"), attempt)
+            logger.debug("⏳ Jira returned %s, retrying in %.1fs", status, delay)
+            await asyncio.sleep(delay)
 
-    def _discover_epic_mappings(self) -> Dict[str, str]:
-        """Discover existing epics in the project and create mappings."""
         try:
-            # Use direct Jira API to search for epics
-            import base64
+            return status, orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return status, raw.decode("utf-8", errors="replace")
 
-            import requests
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before retry ``attempt``, honouring ``Retry-After``."""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            # Missing, or an HTTP date we don't bother parsing
+            delay = RETRY_BACKOFF * 2**attempt
+        return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+    def _start_rate_limit(self):
+        """Give the running event loop a limiter at the configured rate."""
+        self._limiter = AsyncLimiter(JIRA_RATE_LIMIT, 1)
+        self._slowed_until = 0.0
+
+    def _adapt_rate_limit(self, headers):
+        """Halve the request rate for a while when Jira reports we are near its limit.
+
+        The slower budget is a new limiter; requests already queued on the old
+        one still go out at the old rate.
+        """
+        now = time.monotonic()
+        if headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+            if not self._slowed_until:
+                new_rate = max(1, JIRA_RATE_LIMIT // 2)
+                logger.debug(
+                    "⚠️  Near Jira rate limit, slowing to %s requests/s", new_rate
+                )
+                self._limiter = AsyncLimiter(new_rate, 1)
+            self._slowed_until = now + RATE_LIMIT_COOLDOWN
+        elif self._slowed_until and now >= self._slowed_until:
+            logger.debug("✅ Restoring Jira rate to %s requests/s", JIRA_RATE_LIMIT)
+            self._start_rate_limit()
+
+    def _new_async_session(self) -> "aiohttp.ClientSession":
+        """Create a keep-alive aiohttp session for one batch run."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=JIRA_CONCURRENCY, keepalive_timeout=30
+        )
+        return aiohttp.ClientSession(connector=connector, headers=self._json_headers)
 
-            # Prepare authentication
-            auth_string = f"{self.jira_username}:{self.jira_api_token}"
-            auth_bytes = auth_string.encode("ascii")
-            auth_b64 = base64.b64encode(auth_bytes).decode("ascii")
+    def invalidate_epic_cache(self):
+        """Forget cached epic mappings so the next discovery queries Jira."""
+        self._epic_cache.pop(self.project_key, None)
 
-            headers = {
-                "Authorization": f"Basic {auth_b64}",
-                "Content-Type": "application/json",
-            }
+    def _discover_epic_mappings(self) -> Dict[str, str]:
+        """Discover existing epics, reusing results younger than EPIC_CACHE_TTL."""
+        cached = self._epic_cache.get(self.project_key)
+        if cached and time.monotonic() - cached[0] < EPIC_CACHE_TTL:
+            return dict(cached[1])
+
+        epic_mappings = self._search_epic_mappings()
+        if epic_mappings is None:
+            return {}
 
+        self._epic_cache[self.project_key] = (time.monotonic(), epic_mappings)
+        # Callers extend the mappings, so never hand out the cached dict itself
+        return dict(epic_mappings)
+
+    def _search_epic_mappings(self) -> Optional[Dict[str, str]]:
+        """Search the project for epics and map their prefixes to keys."""
+        try:
             # Search for epics in the project
             url = f"{self.jira_url}/rest/api/2/search"
             params = {
@@ -663,13 +1169,15 @@ class JiraIntegration:
                 "maxResults": 100,
             }
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self._session.get(url, params=params)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 epics = data.get("issues", [])
 
                 epic_mappings = {}
-                print(f"🔍 Discovered {len(epics)} epics in project {self.project_key}")
+                logger.info(
+                    "🔍 Discovered %s epics in project %s", len(epics), self.project_key
+                )
 
                 for epic in epics:
                     key = epic.get("key")
@@ -680,7 +1188,7 @@ class JiraIntegration:
                     epic_prefix = None
 
                     # Pattern 1: [PREFIX] Title
-                    bracket_match = re.match(r"^\[([A-Z]+)\]", summary)
+                    bracket_match = _BRACKET_PREFIX_ONLY.match(summary)
                     if bracket_match:
                         epic_prefix = bracket_match.group(1)
 
@@ -698,17 +1206,23 @@ class JiraIntegration:
 
                     if epic_prefix:
                         epic_mappings[epic_prefix] = key
-                        print(f"🔗 Mapped epic: {epic_prefix} -> {key} ({summary})")
+                        logger.debug(
+                            "🔗 Mapped epic: %s -> %s (%s)", epic_prefix, key, summary
+                        )
                     else:
-                        print(
-                            f"⚠️  Could not extract prefix from epic: {key} ({summary})"
+                        logger.warning(
+                            "⚠️  Could not extract prefix from epic: %s (%s)",
+                            key,
+                            summary,
                         )
 
                 return epic_mappings
             else:
-                print(f"⚠️  Failed to search for epics: {response.status_code}")
-                return {}
+                logger.warning(
+                    "⚠️  Failed to search for epics: %s", response.status_code
+                )
+                return None
 
         except Exception as e:
-            print(f"⚠️  Error discovering epic mappings: {e}")
-            return {}
+            logger.warning("⚠️  Error discovering epic mappings: %s", e)
+            return None
@@ -0,0 +1,111 @@
+"""
+On-disk cache for LLM ticket enhancements and fallback parses.
+
+Both depend only on the content sent in the prompt, so repeat runs over the
+same input can reuse earlier responses instead of paying for another LLM call.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+from parser import JiraIssue
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "llm")
+DEFAULT_TTL_SECONDS = 86400
+
+
+class FileBackend:
+    """Store each cache entry as a JSON file named after its key."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry, or None if it is missing or unreadable."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def write(self, key: str, entry: Dict[str, Any]):
+        """Store an entry, replacing the file atomically.
+
+        Failing to write (read-only directory, full disk) only loses the
+        cache entry, so it is logged rather than raised.
+        """
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # A unique temporary name, so concurrent runs never share one
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning("⚠️  Could not write LLM cache entry: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+class LLMCache:
+    """Cache of LLM responses with a time-to-live and hit/miss counters."""
+
+    def __init__(
+        self,
+        backend: Optional[FileBackend] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        self.backend = backend or FileBackend()
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key_for(issue: JiraIssue) -> str:
+        """Hash the issue fields that make up the enhancement prompt."""
+        payload = {
+            "title": issue.title,
+            "desc": issue.description,
+            "type": issue.issue_type.value,
+            "criteria": [
+                criteria.description for criteria in issue.acceptance_criteria
+            ],
+        }
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def key_for_text(text: str) -> str:
+        """Hash parser input for the LLM fallback, ignoring whitespace layout."""
+        normalized = " ".join(text.split())
+        return hashlib.sha256(b"parse\0" + normalized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expiry."""
+        entry = self.backend.read(key)
+        if entry is None or time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return entry.get("value")
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serialisable value under key."""
+        self.backend.write(key, {"stored_at": time.time(), "value": value})
@@ -4,14 +4,39 @@ Automated Jira ticket creation using LangChain and Jira Toolkit.
 Generates epics, stories, and tasks from text input.
 """
 
+import asyncio
+import atexit
+import dataclasses
+import logging
+import os
+import queue
 import sys
-from typing import List
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
+import orjson
 
-from jira_integration import JiraIntegration
+from llm_cache import LLMCache
 from parser import JiraIssue, TextParser
 
+if TYPE_CHECKING:
+    from jira_integration import JiraIntegration
+
+# Where a successful connection check is remembered, and for how long
+PROJECT_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "jira-langchain", "project.json"
+)
+PROJECT_CACHE_TTL = 3600
+
+# Default for --parallel-enhance; the same as jira_integration's
+# ENHANCE_CONCURRENCY, repeated so --help doesn't import the integration
+DEFAULT_PARALLEL_ENHANCE = 8
+
+# Background thread writing queued log records, once configure_logging has run
+_log_listener: Optional[QueueListener] = None
+
 
 @click.command()
 @click.option(
@@ -37,7 +62,37 @@ from parser import JiraIssue, TextParser
     type=click.Path(exists=True),
     help="Path to custom .env configuration file",
 )
-def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: str):
+@click.option(
+    "--refresh-connection",
+    is_flag=True,
+    help="Check the Jira connection even if it succeeded recently",
+)
+@click.option(
+    "--yes", "-y", is_flag=True, help="Create tickets without asking for confirmation"
+)
+@click.option(
+    "--parallel-enhance",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PARALLEL_ENHANCE,
+    show_default=True,
+    help="Maximum concurrent LLM calls with --enhance (LLM_RPM caps the rate)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't reuse or store LLM responses from earlier runs",
+)
+def main(
+    input_file: str,
+    dry_run: bool,
+    enhance: bool,
+    verbose: bool,
+    config: str,
+    refresh_connection: bool,
+    yes: bool,
+    parallel_enhance: int,
+    no_cache: bool,
+):
     """
     Create Jira tickets from text input using LangChain and Jira Toolkit.
 
@@ -45,8 +100,11 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
     python main.py -i tickets.txt
     python main.py -i tickets.txt --dry-run
     python main.py -i tickets.txt --enhance
+    python main.py -i tickets.txt --yes
     """
 
+    configure_logging(verbose)
+
     if config:
         # Load custom config file
         from dotenv import load_dotenv
@@ -58,7 +116,9 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
         if verbose:
             click.echo(f"Parsing input file: {input_file}")
 
-        parser = TextParser()
+        # One on-disk cache serves both the parser's LLM fallback and --enhance
+        llm_cache = None if no_cache else LLMCache()
+        parser = TextParser(llm_cache=llm_cache)
         issues = parser.parse_file(input_file)
 
         if not issues:
@@ -77,10 +137,13 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
             click.echo("\n🔍 Dry run mode - no tickets will be created in Jira")
             return
 
-        # Initialize Jira integration
+        # Initialize Jira integration; imported here because langchain and the
+        # HTTP clients take most of a second to load and dry runs never need them
         if verbose:
             click.echo("\nInitializing Jira connection...")
 
+        from jira_integration import JiraIntegration
+
         try:
             jira_integration = JiraIntegration()
         except ValueError as e:
@@ -88,16 +151,13 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
             click.echo("Please check your .env file or use --config option")
             sys.exit(1)
 
-        # Test connection
+        # Test connection, unless it succeeded within the last hour
         try:
-            project_info = jira_integration.get_project_info()
+            project_info = check_connection(jira_integration, refresh_connection)
             if verbose:
-                if isinstance(project_info, dict):
-                    click.echo(
-                        f"✅ Connected to project: {project_info.get('name', 'Unknown')}"
-                    )
-                else:
-                    click.echo(f"✅ Connected to Jira: {project_info}")
+                click.echo(
+                    f"✅ Connected to project: {project_info.get('name', 'Unknown')}"
+                )
         except Exception as e:
             click.echo(f"❌ Failed to connect to Jira: {e}", err=True)
             sys.exit(1)
@@ -107,41 +167,49 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
             if verbose:
                 click.echo("\n🤖 Enhancing tickets with LLM...")
 
-            enhanced_issues = []
-            for issue in issues:
-                try:
-                    enhanced_issue = jira_integration.enhance_with_llm(issue)
-                    enhanced_issues.append(enhanced_issue)
-                    if verbose:
-                        click.echo(f"  ✅ Enhanced: {issue.title}")
-                except Exception as e:
-                    click.echo(f"  ⚠️  Could not enhance '{issue.title}': {e}")
-                    enhanced_issues.append(issue)
-
-            issues = enhanced_issues
+            issues = enhance_issues(
+                jira_integration,
+                issues,
+                verbose,
+                concurrency=parallel_enhance,
+                cache=llm_cache,
+            )
 
         # Create tickets
-        if not click.confirm(f"\n🎫 Create {len(issues)} tickets in Jira?"):
+        if not yes and not click.confirm(f"\n🎫 Create {len(issues)} tickets in Jira?"):
             click.echo("Operation cancelled.")
             return
 
         if verbose:
             click.echo("\n📝 Creating tickets...")
 
-        results = jira_integration.create_issues_batch(issues)
+        results = asyncio.run(jira_integration.acreate_issues_batch(issues))
+        # Let queued progress messages out before the summary is echoed
+        flush_logging()
 
-        # Display results
-        click.echo("\n✅ Tickets created successfully:")
+        # Display results; a failed ticket doesn't stop the rest of the batch.
+        # Every result is a dict, and only created issues have a key
+        created, failed = [], []
         for result in results:
-            if isinstance(result, dict) and "key" in result:
-                ticket_url = f"{jira_integration.jira_url}/browse/{result['key']}"
-                click.echo(f"  • {result['key']}: {ticket_url}")
-            else:
-                click.echo(f"  • {result}")
-
-        click.echo(f"\n🎉 Created {len(results)} tickets successfully!")
+            (created if "key" in result else failed).append(result)
+
+        if created:
+            click.echo("\n✅ Tickets created successfully:")
+            browse_prefix = f"{jira_integration.jira_url}/browse/"
+            for result in created:
+                key = result["key"]
+                click.echo(f"  • {key}: {browse_prefix}{key}")
+
+        if failed:
+            click.echo("\n⚠️  Tickets that could not be created:", err=True)
+            for result in failed:
+                click.echo(f"  • {result}", err=True)
+            click.echo(f"\n🎫 Created {len(created)} of {len(results)} tickets")
+        else:
+            click.echo(f"\n🎉 Created {len(results)} tickets successfully!")
 
     except Exception as e:
+        flush_logging()
         click.echo(f"❌ Error: {e}", err=True)
         if verbose:
             import traceback
@@ -150,54 +218,182 @@ def main(input_file: str, dry_run: bool, enhance: bool, verbose: bool, config: s
         sys.exit(1)
 
 
+def check_connection(
+    jira_integration: "JiraIntegration", refresh: bool = False
+) -> Dict[str, Any]:
+    """Return project info, probing Jira only when no recent result is cached."""
+    if not refresh:
+        try:
+            with open(PROJECT_CACHE_FILE, "rb") as f:
+                cached = orjson.loads(f.read())
+            # Valid JSON that isn't an object is a corrupt cache, not a hit
+            if not isinstance(cached, dict):
+                cached = None
+            if (
+                cached is not None
+                and cached.get("url") == jira_integration.jira_url
+                and cached.get("project") == jira_integration.project_key
+                and time.time() - cached.get("ts", 0) < PROJECT_CACHE_TTL
+            ):
+                issue_types = cached.get("issue_types", [])
+                jira_integration.remember_issue_types(issue_types)
+                return {"name": cached.get("name"), "issueTypes": issue_types}
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+    project_info = jira_integration.get_project_info()
+
+    # Failing to remember the result must not fail the run
+    try:
+        os.makedirs(os.path.dirname(PROJECT_CACHE_FILE), exist_ok=True)
+        with open(PROJECT_CACHE_FILE, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    {
+                        "url": jira_integration.jira_url,
+                        "project": jira_integration.project_key,
+                        "name": project_info.get("name"),
+                        "issue_types": [
+                            {"id": issue_type.get("id"), "name": issue_type.get("name")}
+                            for issue_type in project_info.get("issueTypes", [])
+                        ],
+                        "ts": time.time(),
+                    }
+                )
+            )
+    except OSError:
+        pass
+
+    return project_info
+
+
+def enhance_issues(
+    jira_integration: "JiraIntegration",
+    issues: List[JiraIssue],
+    verbose: bool,
+    concurrency: int = DEFAULT_PARALLEL_ENHANCE,
+    cache: Optional[LLMCache] = None,
+) -> List[JiraIssue]:
+    """Enhance issues with the LLM, reusing results cached by earlier runs."""
+    keys = [LLMCache.key_for(issue) for issue in issues]
+    if cache is not None:
+        cached = [cache.get(key) for key in keys]
+    else:
+        cached = [None] * len(issues)
+
+    # Only cache misses go to the LLM, all concurrently; a failed call keeps
+    # the original issue
+    misses = [issue for issue, hit in zip(issues, cached) if hit is None]
+    fresh = iter(
+        asyncio.run(_enhance_while_preparing(jira_integration, misses, concurrency))
+    )
+
+    enhanced_issues = []
+    for issue, key, hit in zip(issues, keys, cached):
+        if hit is not None:
+            enhanced_issue = dataclasses.replace(issue, description=hit)
+        else:
+            enhanced_issue = next(fresh)
+            if enhanced_issue is issue:
+                click.echo(f"  ⚠️  Could not enhance '{issue.title}'")
+                enhanced_issues.append(issue)
+                continue
+            if cache is not None:
+                cache.set(key, enhanced_issue.description)
+
+        enhanced_issues.append(enhanced_issue)
+        if verbose:
+            click.echo(f"  ✅ Enhanced: {issue.title}")
+
+    if verbose and cache is not None:
+        click.echo(
+            f"  💾 LLM cache: {cache.stats['hits']} hits, "
+            f"{cache.stats['misses']} misses"
+        )
+
+    return enhanced_issues
+
+
+async def _enhance_while_preparing(
+    jira_integration: "JiraIntegration", issues: List[JiraIssue], concurrency: int
+) -> List[JiraIssue]:
+    """Enhance issues while the Jira lookups for creating them are warmed up."""
+    enhanced, _ = await asyncio.gather(
+        jira_integration.enhance_many(issues, concurrency=concurrency),
+        jira_integration.aprepare_batch(),
+    )
+    return enhanced
+
+
+def configure_logging(verbose: bool):
+    """Send log records through a queue so emitting them never blocks on stdout."""
+    global _log_listener
+
+    # Repeated calls, e.g. main() invoked twice in one process, only adjust
+    # the level rather than adding another handler and listener
+    if _log_listener is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, handler)
+        _log_listener.start()
+        # Flush whatever is still queued on exit, including sys.exit() paths
+        atexit.register(_log_listener.stop)
+
+        # Third-party libraries stay at WARNING; our progress messages are INFO
+        root = logging.getLogger()
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(logging.WARNING)
+
+    logging.getLogger("jira_integration").setLevel(
+        logging.DEBUG if verbose else logging.INFO
+    )
+
+
+def flush_logging():
+    """Write out every queued log record before printing directly."""
+    if _log_listener is not None:
+        # stop() drains the queue and joins the thread; restart it for
+        # anything logged afterwards
+        _log_listener.stop()
+        _log_listener.start()
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to ``limit`` characters, marking the cut with an ellipsis."""
+    return text[:limit] + "..." if text[limit : limit + 1] else text
+
+
+# Issue fields shown by display_issues, in order, with their formatters;
+# empty fields are skipped
+_DISPLAY_FIELDS = (
+    ("priority", "Priority", lambda value: value.value),
+    ("epic_name", "Epic Name", str),
+    ("parent", "Parent Epic", str),
+    ("story_key", "Story Key", str),
+    ("dependencies", "Dependencies", str),
+    ("estimated_effort", "Estimated Effort", str),
+    ("labels", "Labels", str),
+    ("description", "Description", _truncate),
+    ("business_outcome", "Business Outcome", _truncate),
+    ("acceptance_criteria", "Acceptance Criteria", lambda value: f"{len(value)} items"),
+)
+
+
 def display_issues(issues: List[JiraIssue]):
     """Display parsed issues in a formatted way."""
-    click.echo("\n📋 Parsed Issues:")
-    click.echo("=" * 50)
+    # Collect every line and write once instead of one echo per field
+    lines = ["\n📋 Parsed Issues:", "=" * 50]
 
     for i, issue in enumerate(issues, 1):
-        click.echo(f"\n{i}. {issue.issue_type.value}: {issue.title}")
-        click.echo(f"   Priority: {issue.priority.value}")
-
-        if issue.epic_name:
-            click.echo(f"   Epic Name: {issue.epic_name}")
+        lines.append(f"\n{i}. {issue.issue_type.value}: {issue.title}")
+        for attr, label, fmt in _DISPLAY_FIELDS:
+            value = getattr(issue, attr)
+            if value:
+                lines.append(f"   {label}: {fmt(value)}")
 
-        if issue.parent:
-            click.echo(f"   Parent Epic: {issue.parent}")
-
-        if issue.story_key:
-            click.echo(f"   Story Key: {issue.story_key}")
-
-        if issue.dependencies:
-            click.echo(f"   Dependencies: {issue.dependencies}")
-
-        if issue.estimated_effort:
-            click.echo(f"   Estimated Effort: {issue.estimated_effort}")
-
-        if issue.labels:
-            click.echo(f"   Labels: {issue.labels}")
-
-        if issue.description:
-            # Truncate long descriptions
-            desc = (
-                issue.description[:100] + "..."
-                if len(issue.description) > 100
-                else issue.description
-            )
-            click.echo(f"   Description: {desc}")
-
-        if issue.business_outcome:
-            outcome = (
-                issue.business_outcome[:100] + "..."
-                if len(issue.business_outcome) > 100
-                else issue.business_outcome
-            )
-            click.echo(f"   Business Outcome: {outcome}")
-
-        if issue.acceptance_criteria:
-            click.echo(
-                f"   Acceptance Criteria: {len(issue.acceptance_criteria)} items"
-            )
+    click.echo("\n".join(lines))
 
 
 @click.command()
@@ -246,7 +442,7 @@ LLM_PROVIDER={llm_provider}
     elif llm_provider == "google":
         env_content += f"GOOGLE_API_KEY={llm_api_key}\n"
 
-    with open(".env", "w") as f:
+    with open(".env", "w", buffering=65536, encoding="utf-8") as f:
         f.write(env_content)
 
     click.echo("✅ Configuration saved to .env file")
@@ -1,14 +1,96 @@
-import json
+import functools
 import os
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
+import orjson
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from llm_cache import LLMCache
+
+# Read buffer for input files; well above the 8 KiB default so large ticket
+# dumps are read in few system calls
+READ_BUFFER_SIZE = 256 * 1024
+
+# Section headers, compiled once; "Epic 1: Title" and "Story 2: Title".
+# Group 1 is the title, or None for a header without one
+_EPIC_HEADER_RE = re.compile(r"^Epic \d+:(?: (.+))?")
+_STORY_HEADER_RE = re.compile(r"^Story \d+:(?: (.+))?")
+
+# Line openings of an "As a ... I want ... So that ..." user story
+_USER_STORY_PREFIXES = ("As a ", "I want ", "So that ")
+
+# A Markdown code fence around the LLM's JSON answer; group 1 is the body,
+# up to the closing fence or the end of the response
+_CODE_FENCE_RE = re.compile(r"\A```(?:json)?(.*?)(?:```|\Z)", re.DOTALL)
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Instructions sent ahead of every LLM fallback request
+_LLM_SYSTEM_PROMPT = """You are an expert at extracting Jira issues from text.
+Given text content, extract all Epics, Stories, and Tasks with their details.
+
+Return the result as a JSON array of objects with this exact structure:
+[
+  {
+    "title": "Issue title",
+    "description": "Full description",
+    "issue_type": "Epic|Story|Task",
+    "priority": "Highest|High|Medium|Low|Lowest",
+    "story_key": "optional story key",
+    "acceptance_criteria": ["criterion 1", "criterion 2"],
+    "business_outcome": "optional business outcome",
+    "epic_name": "optional epic name",
+    "parent": "optional parent reference",
+    "dependencies": "optional dependencies",
+    "estimated_effort": "optional effort estimate",
+    "labels": "optional labels"
+  }
+]
+
+Guidelines:
+- Extract all issues you can find
+- Use "Story" as default issue type if unclear
+- Use "Medium" as default priority if unclear
+- Combine multi-line content appropriately
+- Extract acceptance criteria as separate items
+- Be comprehensive but accurate
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from .env, once per process."""
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=None)
+def _create_llm(provider: str, api_key: str):
+    """Build the fallback LLM client; parsers with the same config share one."""
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model="claude-3-5-sonnet-20240620", anthropic_api_key=api_key
+        )
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _system_message():
+    """The fallback LLM's system message, built once and reused."""
+    from langchain.schema import SystemMessage
+
+    return SystemMessage(content=_LLM_SYSTEM_PROMPT)
 
 
 class Priority(str, Enum):
@@ -25,19 +107,32 @@ class IssueType(str, Enum):
     TASK = "Task"
 
 
-@dataclass
-class AcceptanceCriteria:
+# Lookups for the enums by name; the exact-case values ("High", "Story") hit
+# first so the common inputs skip the strip().lower() copies
+_PRIORITY_BY_NAME = {
+    **{priority.value.lower(): priority for priority in Priority},
+    **{priority.value: priority for priority in Priority},
+}
+_ISSUE_TYPE_BY_NAME = {
+    **{issue_type.value.lower(): issue_type for issue_type in IssueType},
+    **{issue_type.value: issue_type for issue_type in IssueType},
+}
+
+
+class AcceptanceCriteria(NamedTuple):
+    # A NamedTuple rather than a dataclass: it is built in C and is smaller,
+    # which adds up for stories with many criteria
     description: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class JiraIssue:
     title: str
     description: str
     issue_type: IssueType
     priority: Priority = Priority.MEDIUM
     story_key: Optional[str] = None
-    acceptance_criteria: List[AcceptanceCriteria] = None
+    acceptance_criteria: List[AcceptanceCriteria] = field(default_factory=list)
     business_outcome: Optional[str] = None
     epic_name: Optional[str] = None
     parent: Optional[str] = None
@@ -45,24 +140,79 @@ class JiraIssue:
     estimated_effort: Optional[str] = None
     labels: Optional[str] = None
 
-    def __post_init__(self):
-        if self.acceptance_criteria is None:
-            self.acceptance_criteria = []
+
+@dataclass(**_DATACLASS_SLOTS)
+class _IssueDraft:
+    """Fields collected for one issue before TextParser finalizes it."""
+
+    title: Optional[str] = None
+    epic_name: Optional[str] = None
+    # Joined with spaces when the epic is finalized; None if never given
+    business_outcome_lines: Optional[List[str]] = None
+    priority: Optional[Priority] = None
+    story_key: Optional[str] = None
+    user_story: Optional[str] = None
+    description: Optional[str] = None
+    parent: Optional[str] = None
+    dependencies: Optional[str] = None
+    estimated_effort: Optional[str] = None
+    labels: Optional[str] = None
+
+    def __bool__(self):
+        # A header with nothing collected under it is skipped, not finalized
+        return self != _EMPTY_DRAFT
+
+
+_EMPTY_DRAFT = _IssueDraft()
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class _EpicParseState:
+    """Position within the epic format while TextParser walks its lines."""
+
+    epic: Optional[_IssueDraft] = None
+    story: Optional[_IssueDraft] = None
+    description: List[str] = field(default_factory=list)
+    acceptance_criteria: List[AcceptanceCriteria] = field(default_factory=list)
+    in_acceptance_criteria: bool = False
+    in_description: bool = False
+    in_business_outcome: bool = False
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class _StoryParseState:
+    """Position within the story format while TextParser walks its lines."""
+
+    story: Optional[_IssueDraft] = None
+    acceptance_criteria: List[AcceptanceCriteria] = field(default_factory=list)
+    in_acceptance_criteria: bool = False
+    user_story_lines: List[str] = field(default_factory=list)
 
 
 class TextParser:
     """Parser for text input containing Jira tickets in the specified format."""
 
-    def __init__(self, enable_llm_fallback: bool = True):
+    def __init__(
+        self, enable_llm_fallback: bool = True, llm_cache: Optional["LLMCache"] = None
+    ):
         self.current_section = None
         self.current_issue = None
         self.issues = []
         self.enable_llm_fallback = enable_llm_fallback
+        # Earlier LLM fallback answers, keyed by the input text
+        self.llm_cache = llm_cache
+
+        # The fallback LLM is only created when a parse actually needs it
         self.llm = None
+        self._llm_initialized = False
 
-        # Initialize LLM if fallback is enabled
-        if self.enable_llm_fallback:
+    def _get_llm(self):
+        """Return the fallback LLM, initializing it on first use."""
+        if not self._llm_initialized:
+            self._llm_initialized = True
+            _load_env()
             self.llm = self._initialize_llm()
+        return self.llm
 
     def _initialize_llm(self):
         """Initialize the LLM for fallback parsing."""
@@ -70,25 +220,17 @@ class TextParser:
             provider = os.getenv("LLM_PROVIDER", "anthropic").lower()
 
             if provider == "anthropic":
-                from langchain_anthropic import ChatAnthropic
-
                 api_key = os.getenv("ANTHROPIC_API_KEY")
                 if not api_key:
                     print("⚠️  ANTHROPIC_API_KEY not found - LLM fallback disabled")
                     return None
-                return ChatAnthropic(
-                    model="claude-3-5-sonnet-20240620", anthropic_api_key=api_key
-                )
+                return _create_llm(provider, api_key)
             elif provider == "google":
-                from langchain_google_genai import ChatGoogleGenerativeAI
-
                 api_key = os.getenv("GOOGLE_API_KEY")
                 if not api_key:
                     print("⚠️  GOOGLE_API_KEY not found - LLM fallback disabled")
                     return None
-                return ChatGoogleGenerativeAI(
-                    model="gemini-pro", google_api_key=api_key
-                )
+                return _create_llm(provider, api_key)
             else:
                 print(
                     f"⚠️  Unsupported LLM provider: {provider} - LLM fallback disabled"
@@ -103,347 +245,397 @@ class TextParser:
             return None
 
     def parse_file(self, file_path: str) -> List[JiraIssue]:
-        """Parse a text file and extract Jira issues."""
+        """Parse a text file and extract Jira issues.
+
+        The structured parse is cached per file until its modification time
+        or size changes, so re-parsing an unchanged file is a lookup. The LLM
+        fallback is never cached here; it runs per call when needed.
+        """
+        stat = os.stat(file_path)
+        stripped, cached_issues = _parse_file_structured(
+            os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+        )
+        # Cached issues are shared between callers, so hand out copies
+        issues = [_copy_issue(issue) for issue in cached_issues]
+        self.issues = issues
+        # A blank file has nothing to send to the LLM, as in parse_text
+        if not stripped:
+            return issues
+        if not self._should_use_llm_fallback(stripped, issues):
+            return issues
+
+        # Only the LLM needs the input as a single string; read it again now
+        # rather than keeping the raw text cached for this rare case
         with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+            text = f.read()
 
-        return self.parse_text(content)
+        print("🤖 Structured parsing incomplete - trying LLM fallback...")
+        return self._pick_fallback_result(issues, self._parse_with_llm(text))
 
     def parse_text(self, text: str) -> List[JiraIssue]:
         """Parse text content and extract Jira issues."""
+        # Blank input has nothing to parse, nor anything to send to the LLM
+        if not text or text.isspace():
+            self.issues = []
+            return self.issues
+
+        stripped, issues = self._parse_structured(text.splitlines())
+        if not self._should_use_llm_fallback(stripped, issues):
+            return issues
+
+        print("🤖 Structured parsing incomplete - trying LLM fallback...")
+        return self._pick_fallback_result(issues, self._parse_with_llm(text))
+
+    async def aparse_text(self, text: str) -> List[JiraIssue]:
+        """Parse text content, awaiting the LLM fallback instead of blocking.
+
+        Several inputs can be parsed concurrently with ``asyncio.gather``, so
+        their fallback calls overlap rather than running one after another.
+        """
+        if not text or text.isspace():
+            self.issues = []
+            return self.issues
+
+        stripped, issues = self._parse_structured(text.splitlines())
+        if not self._should_use_llm_fallback(stripped, issues):
+            return issues
+
+        print("🤖 Structured parsing incomplete - trying LLM fallback...")
+        return self._pick_fallback_result(issues, await self._aparse_with_llm(text))
+
+    def _parse_structured(
+        self, lines: Iterable[str]
+    ) -> Tuple[Tuple[str, ...], List[JiraIssue]]:
+        """Run the structured parser; returns the stripped lines and issues."""
         self.issues = []
-        lines = text.split("\n")
 
-        # Detect format by looking for key patterns
-        has_epic_pattern = any(re.match(r"^Epic \d+:", line.strip()) for line in lines)
-        has_story_pattern = any(line.strip().startswith("Story: ") for line in lines)
+        # Strip every line once and drop blank ones; detection, both format
+        # parsers and the fallback heuristics all read this same tuple
+        stripped = tuple(filter(None, map(str.strip, lines)))
+
+        # Detect format by looking for an "Epic N:" header; the cheap prefix
+        # test rejects almost every line before the pattern runs, and the scan
+        # stops at the first header found
+        has_epic_pattern = any(
+            line.startswith("Epic ") and _EPIC_HEADER_RE.match(line)
+            for line in stripped
+        )
 
         if has_epic_pattern:
-            issues = self._parse_epic_format(lines)
-        elif has_story_pattern:
-            issues = self._parse_story_format(lines)
+            issues = self._parse_epic_format(stripped)
         else:
-            # Try to parse as story format by default
-            issues = self._parse_story_format(lines)
-
-        # Check if we should use LLM fallback
-        if self._should_use_llm_fallback(text, issues):
-            print("🤖 Structured parsing incomplete - trying LLM fallback...")
-            llm_issues = self._parse_with_llm(text)
-            if llm_issues:
-                print(f"✅ LLM fallback extracted {len(llm_issues)} issues")
-                return llm_issues
-            else:
-                print("⚠️  LLM fallback failed - using structured parsing results")
+            # "Story: " headers and unrecognised text both use the story format
+            issues = self._parse_story_format(stripped)
+
+        return stripped, issues
+
+    def _pick_fallback_result(
+        self, issues: List[JiraIssue], llm_issues: List[JiraIssue]
+    ) -> List[JiraIssue]:
+        """Prefer the LLM's issues, keeping the structured ones if it failed."""
+        if llm_issues:
+            print(f"✅ LLM fallback extracted {len(llm_issues)} issues")
+            return llm_issues
 
+        print("⚠️  LLM fallback failed - using structured parsing results")
         return issues
 
-    def _parse_epic_format(self, lines: List[str]) -> List[JiraIssue]:
-        """Parse the original epic format."""
-        current_epic = None
-        current_story = None
-        current_description = []
-        current_acceptance_criteria = []
-        in_acceptance_criteria = False
-        in_description = False
-        in_business_outcome = False
+    def _parse_epic_format(self, lines: Sequence[str]) -> List[JiraIssue]:
+        """Parse the original epic format from stripped, non-blank lines."""
+        state = _EpicParseState()
+        # Bind the per-line lookups to locals once; the loop runs per line
+        get_handler = self._EPIC_FIELD_HANDLERS.get
+        match_epic_header = _EPIC_HEADER_RE.match
+        match_story_header = _STORY_HEADER_RE.match
 
         for line in lines:
-            line = line.strip()
-
-            # Skip empty lines
-            if not line:
+            # "Field: value" lines go straight to their handler
+            head, colon, tail = line.partition(":")
+            handler = get_handler(head) if colon else None
+            if handler:
+                handler(self, state, tail.strip())
                 continue
 
             # Check for Epic section (Epic 1:, Epic 2:, etc.)
-            if re.match(r"^Epic \d+:", line):
-                if current_epic:
-                    self._finalize_epic(current_epic, current_description)
-                current_epic = {}
-                current_description = []
-                in_description = False
-                in_business_outcome = False
+            epic_match = match_epic_header(line)
+            if epic_match:
+                if state.epic:
+                    self._finalize_epic(state.epic, state.description)
+                state.epic = _IssueDraft()
+                state.description = []
+                state.in_description = False
+                state.in_business_outcome = False
 
                 # Extract epic title from "Epic 1: Title"
-                epic_match = re.search(r"Epic \d+: (.+)", line)
-                if epic_match:
-                    current_epic["title"] = epic_match.group(1).strip()
-                continue
-
-            # Check for Epic Name
-            if line.startswith("Epic Name:"):
-                if current_epic is not None:
-                    current_epic["epic_name"] = line.replace("Epic Name:", "").strip()
-                continue
-
-            # Check for Description section
-            if line.startswith("Description:"):
-                if current_epic is not None:
-                    in_description = True
-                    in_business_outcome = False
-                    # Check if description is on the same line
-                    desc_text = line.replace("Description:", "").strip()
-                    if desc_text:
-                        current_description = [desc_text]
-                    else:
-                        current_description = []
-                continue
-
-            # Check for Business Outcome section
-            if line.startswith("Business Outcome:"):
-                if current_epic is not None:
-                    in_description = False
-                    in_business_outcome = True
-                    # Check if business outcome is on the same line
-                    bo_text = line.replace("Business Outcome:", "").strip()
-                    if bo_text:
-                        current_epic["business_outcome"] = bo_text
-                    else:
-                        current_epic["business_outcome"] = ""
-                continue
-
-            # Check for Priority
-            if line.startswith("Priority:"):
-                priority_str = line.replace("Priority:", "").strip()
-                if current_story is not None:
-                    current_story["priority"] = self._parse_priority(priority_str)
-                elif current_epic is not None:
-                    current_epic["priority"] = self._parse_priority(priority_str)
-                in_description = False
-                in_business_outcome = False
+                if epic_match.group(1):
+                    state.epic.title = epic_match.group(1).strip()
                 continue
 
             # Check for Story section
-            if re.match(r"^Story \d+:", line):
-                if current_story:
-                    self._finalize_story(current_story, current_acceptance_criteria)
-                current_story = {}
-                current_acceptance_criteria = []
-                in_acceptance_criteria = False
-                in_description = False
-                in_business_outcome = False
+            story_match = match_story_header(line)
+            if story_match:
+                if state.story:
+                    self._finalize_story(state.story, state.acceptance_criteria)
+                state.story = _IssueDraft()
+                state.acceptance_criteria = []
+                state.in_acceptance_criteria = False
+                state.in_description = False
+                state.in_business_outcome = False
 
                 # Extract story title
-                story_match = re.search(r"Story \d+: (.+)", line)
-                if story_match:
-                    current_story["title"] = story_match.group(1).strip()
-                continue
-
-            # Check for Story Key
-            if line.startswith("Story Key:"):
-                if current_story is not None:
-                    story_key = line.replace("Story Key:", "").strip()
-                    current_story["story_key"] = story_key
+                if story_match.group(1):
+                    state.story.title = story_match.group(1).strip()
                 continue
 
             # Check for user story format
-            if line.startswith("As a ") and current_story is not None:
-                current_story["user_story"] = line
-                continue
-
-            # Check for Acceptance Criteria
-            if line.startswith("Acceptance Criteria:"):
-                in_acceptance_criteria = True
-                in_description = False
-                in_business_outcome = False
+            if line.startswith("As a ") and state.story is not None:
+                state.story.user_story = line
                 continue
 
             # Parse acceptance criteria items
-            if in_acceptance_criteria and line.startswith("*"):
+            if state.in_acceptance_criteria and line.startswith("*"):
                 criteria_text = line.replace("*", "").strip()
-                current_acceptance_criteria.append(AcceptanceCriteria(criteria_text))
+                state.acceptance_criteria.append(AcceptanceCriteria(criteria_text))
                 continue
 
             # Handle description content
-            if in_description and current_epic is not None:
-                current_description.append(line)
+            if state.in_description and state.epic is not None:
+                state.description.append(line)
                 continue
 
             # Handle business outcome content
-            if in_business_outcome and current_epic is not None:
-                if current_epic.get("business_outcome"):
-                    current_epic["business_outcome"] += " " + line
-                else:
-                    current_epic["business_outcome"] = line
+            if state.in_business_outcome and state.epic is not None:
+                state.epic.business_outcome_lines.append(line)
                 continue
 
         # Finalize any remaining issues
-        if current_epic:
-            self._finalize_epic(current_epic, current_description)
-        if current_story:
-            self._finalize_story(current_story, current_acceptance_criteria)
+        if state.epic:
+            self._finalize_epic(state.epic, state.description)
+        if state.story:
+            self._finalize_story(state.story, state.acceptance_criteria)
 
         return self.issues
 
-    def _parse_story_format(self, lines: List[str]) -> List[JiraIssue]:
-        """Parse the new story format."""
-        current_story = None
-        current_acceptance_criteria = []
-        in_acceptance_criteria = False
-        user_story_lines = []
+    def _epic_name_field(self, state: "_EpicParseState", value: str):
+        """Handle an "Epic Name:" line."""
+        if state.epic is not None:
+            state.epic.epic_name = value
+
+    def _epic_description_field(self, state: "_EpicParseState", value: str):
+        """Handle a "Description:" line; following lines continue it."""
+        if state.epic is not None:
+            state.in_description = True
+            state.in_business_outcome = False
+            # Check if description is on the same line
+            state.description = [value] if value else []
+
+    def _epic_business_outcome_field(self, state: "_EpicParseState", value: str):
+        """Handle a "Business Outcome:" line; following lines continue it."""
+        if state.epic is not None:
+            state.in_description = False
+            state.in_business_outcome = True
+            state.epic.business_outcome_lines = [value] if value else []
+
+    def _epic_priority_field(self, state: "_EpicParseState", value: str):
+        """Handle a "Priority:" line for the current story, else the epic."""
+        if state.story is not None:
+            state.story.priority = self._parse_priority(value)
+        elif state.epic is not None:
+            state.epic.priority = self._parse_priority(value)
+        state.in_description = False
+        state.in_business_outcome = False
+
+    def _epic_story_key_field(self, state: "_EpicParseState", value: str):
+        """Handle a "Story Key:" line."""
+        if state.story is not None:
+            state.story.story_key = value
+
+    def _epic_acceptance_criteria_field(self, state: "_EpicParseState", value: str):
+        """Handle an "Acceptance Criteria:" line; "*" items follow it."""
+        state.in_acceptance_criteria = True
+        state.in_description = False
+        state.in_business_outcome = False
+
+    # Field name before the first ":" -> handler, for the epic format
+    _EPIC_FIELD_HANDLERS = {
+        "Epic Name": _epic_name_field,
+        "Description": _epic_description_field,
+        "Business Outcome": _epic_business_outcome_field,
+        "Priority": _epic_priority_field,
+        "Story Key": _epic_story_key_field,
+        "Acceptance Criteria": _epic_acceptance_criteria_field,
+    }
+
+    def _parse_story_format(self, lines: Sequence[str]) -> List[JiraIssue]:
+        """Parse the new story format from stripped, non-blank lines."""
+        state = _StoryParseState()
+        get_handler = self._STORY_FIELD_HANDLERS.get
 
         for line in lines:
-            line = line.strip()
-
-            # Skip empty lines
-            if not line:
+            # "Field: value" lines go straight to their handler, so they are
+            # never mistaken for acceptance criteria below
+            head, colon, tail = line.partition(":")
+            handler = get_handler(head) if colon else None
+            if handler:
+                handler(self, state, tail.strip())
                 continue
 
             # Check for Story section
             if line.startswith("Story: "):
-                if current_story:
-                    self._finalize_new_story(current_story, current_acceptance_criteria)
+                if state.story:
+                    self._finalize_new_story(state.story, state.acceptance_criteria)
 
-                current_story = {}
-                current_acceptance_criteria = []
-                in_acceptance_criteria = False
-                user_story_lines = []
+                state.story = _IssueDraft()
+                state.acceptance_criteria = []
+                state.in_acceptance_criteria = False
+                state.user_story_lines = []
 
                 # Extract story title from "Story: [PREFIX] Title"
-                story_title = line.replace("Story: ", "").strip()
-                current_story["title"] = story_title
+                story_title = line.partition(": ")[2].strip()
+                state.story.title = story_title
                 continue
 
             # Check for Parent
-            if line.startswith("Parent: ") and current_story is not None:
-                current_story["parent"] = line.replace("Parent: ", "").strip()
+            if line.startswith("Parent: ") and state.story is not None:
+                state.story.parent = line.partition(": ")[2].strip()
                 continue
 
             # Check for user story format (As a... I want... So that ...)
-            if current_story is not None and (
-                line.startswith("As a ")
-                or line.startswith("I want ")
-                or line.startswith("So that ")
-            ):
-                user_story_lines.append(line)
-                continue
-
-            # Check for Acceptance Criteria
-            if line.startswith("Acceptance Criteria:"):
-                in_acceptance_criteria = True
-                # Save user story as description
-                if current_story is not None and user_story_lines:
-                    current_story["description"] = "\n".join(user_story_lines)
+            if state.story is not None and line.startswith(_USER_STORY_PREFIXES):
+                state.user_story_lines.append(line)
                 continue
 
             # Parse acceptance criteria items (no bullet points in new format)
-            if (
-                in_acceptance_criteria
-                and line
-                and not line.startswith("Priority:")
-                and not line.startswith("Dependencies:")
-                and not line.startswith("Estimated Effort:")
-                and not line.startswith("Labels:")
-            ):
-                current_acceptance_criteria.append(AcceptanceCriteria(line))
-                continue
-
-            # Check for Priority
-            if line.startswith("Priority:") and current_story is not None:
-                priority_str = line.replace("Priority:", "").strip()
-                current_story["priority"] = self._parse_priority(priority_str)
-                in_acceptance_criteria = False
-                continue
-
-            # Check for Dependencies
-            if line.startswith("Dependencies:") and current_story is not None:
-                current_story["dependencies"] = line.replace(
-                    "Dependencies:", ""
-                ).strip()
-                continue
-
-            # Check for Estimated Effort
-            if line.startswith("Estimated Effort:") and current_story is not None:
-                current_story["estimated_effort"] = line.replace(
-                    "Estimated Effort:", ""
-                ).strip()
-                continue
-
-            # Check for Labels
-            if line.startswith("Labels:") and current_story is not None:
-                current_story["labels"] = line.replace("Labels:", "").strip()
+            if state.in_acceptance_criteria:
+                state.acceptance_criteria.append(AcceptanceCriteria(line))
                 continue
 
         # Finalize any remaining story
-        if current_story:
-            self._finalize_new_story(current_story, current_acceptance_criteria)
+        if state.story:
+            self._finalize_new_story(state.story, state.acceptance_criteria)
 
         return self.issues
 
-    def _finalize_epic(self, epic_data: Dict, description_lines: List[str]):
+    def _story_acceptance_criteria_field(self, state: "_StoryParseState", value: str):
+        """Handle an "Acceptance Criteria:" line; one criterion per line follows."""
+        state.in_acceptance_criteria = True
+        # Save user story as description
+        if state.story is not None and state.user_story_lines:
+            state.story.description = "\n".join(state.user_story_lines)
+
+    def _story_priority_field(self, state: "_StoryParseState", value: str):
+        """Handle a "Priority:" line, which also ends the criteria list."""
+        if state.story is not None:
+            state.story.priority = self._parse_priority(value)
+            state.in_acceptance_criteria = False
+
+    def _story_dependencies_field(self, state: "_StoryParseState", value: str):
+        """Handle a "Dependencies:" line."""
+        if state.story is not None:
+            state.story.dependencies = value
+
+    def _story_estimated_effort_field(self, state: "_StoryParseState", value: str):
+        """Handle an "Estimated Effort:" line."""
+        if state.story is not None:
+            state.story.estimated_effort = value
+
+    def _story_labels_field(self, state: "_StoryParseState", value: str):
+        """Handle a "Labels:" line."""
+        if state.story is not None:
+            state.story.labels = value
+
+    # Field name before the first ":" -> handler, for the story format
+    _STORY_FIELD_HANDLERS = {
+        "Acceptance Criteria": _story_acceptance_criteria_field,
+        "Priority": _story_priority_field,
+        "Dependencies": _story_dependencies_field,
+        "Estimated Effort": _story_estimated_effort_field,
+        "Labels": _story_labels_field,
+    }
+
+    def _finalize_epic(self, epic_data: _IssueDraft, description_lines: List[str]):
         """Finalize and add an epic to the issues list."""
         # Use epic_name if available, otherwise use title, otherwise default
-        title = epic_data.get("epic_name") or epic_data.get("title", "Untitled Epic")
+        title = epic_data.epic_name or epic_data.title or "Untitled Epic"
         description = " ".join(description_lines) if description_lines else ""
+        business_outcome = (
+            " ".join(epic_data.business_outcome_lines)
+            if epic_data.business_outcome_lines is not None
+            else None
+        )
 
         epic = JiraIssue(
             title=title,
             description=description,
             issue_type=IssueType.EPIC,
-            priority=epic_data.get("priority", Priority.MEDIUM),
-            business_outcome=epic_data.get("business_outcome"),
-            epic_name=epic_data.get("epic_name"),
+            priority=epic_data.priority or Priority.MEDIUM,
+            business_outcome=business_outcome,
+            epic_name=epic_data.epic_name,
         )
 
         self.issues.append(epic)
 
     def _finalize_story(
-        self, story_data: Dict, acceptance_criteria: List[AcceptanceCriteria]
+        self, story_data: _IssueDraft, acceptance_criteria: List[AcceptanceCriteria]
     ):
         """Finalize and add a story to the issues list."""
-        title = story_data.get("title", "Untitled Story")
-        description = story_data.get("user_story", "")
+        title = story_data.title or "Untitled Story"
+        description = story_data.user_story or ""
 
         story = JiraIssue(
             title=title,
             description=description,
             issue_type=IssueType.STORY,
             priority=Priority.MEDIUM,  # Default priority for stories
-            story_key=story_data.get("story_key"),
+            story_key=story_data.story_key,
             acceptance_criteria=acceptance_criteria,
         )
 
         self.issues.append(story)
 
     def _finalize_new_story(
-        self, story_data: Dict, acceptance_criteria: List[AcceptanceCriteria]
+        self, story_data: _IssueDraft, acceptance_criteria: List[AcceptanceCriteria]
     ):
         """Finalize and add a new format story to the issues list."""
-        title = story_data.get("title", "Untitled Story")
-        description = story_data.get("description", "")
+        title = story_data.title or "Untitled Story"
+        description = story_data.description or ""
 
         story = JiraIssue(
             title=title,
             description=description,
             issue_type=IssueType.STORY,
-            priority=story_data.get("priority", Priority.MEDIUM),
-            story_key=story_data.get("story_key"),
+            priority=story_data.priority or Priority.MEDIUM,
+            story_key=story_data.story_key,
             acceptance_criteria=acceptance_criteria,
-            parent=story_data.get("parent"),
-            dependencies=story_data.get("dependencies"),
-            estimated_effort=story_data.get("estimated_effort"),
-            labels=story_data.get("labels"),
+            parent=story_data.parent,
+            dependencies=story_data.dependencies,
+            estimated_effort=story_data.estimated_effort,
+            labels=story_data.labels,
         )
 
         self.issues.append(story)
 
     def _parse_priority(self, priority_str: str) -> Priority:
         """Parse priority string into Priority enum."""
-        priority_mapping = {
-            "highest": Priority.HIGHEST,
-            "high": Priority.HIGH,
-            "medium": Priority.MEDIUM,
-            "low": Priority.LOW,
-            "lowest": Priority.LOWEST,
-        }
-
-        return priority_mapping.get(priority_str.lower(), Priority.MEDIUM)
+        return _PRIORITY_BY_NAME.get(priority_str) or _PRIORITY_BY_NAME.get(
+            priority_str.strip().lower(), Priority.MEDIUM
+        )
 
-    def _should_use_llm_fallback(self, text: str, issues: List[JiraIssue]) -> bool:
+    def _should_use_llm_fallback(
+        self, lines: Sequence[str], issues: List[JiraIssue]
+    ) -> bool:
         """Determine if LLM fallback should be used."""
-        if not self.enable_llm_fallback or not self.llm:
-            return False
+        # Only pay for creating the LLM once the parse looks incomplete
+        return (
+            self.enable_llm_fallback
+            and self._parse_looks_incomplete(lines, issues)
+            and self._get_llm() is not None
+        )
 
+    def _parse_looks_incomplete(
+        self, lines: Sequence[str], issues: List[JiraIssue]
+    ) -> bool:
+        """Whether structured parsing probably missed content in the input."""
         # Use LLM fallback if:
         # 1. No issues were found
         # 2. Text is substantial but few issues were found (likely incomplete parsing)
@@ -452,84 +644,111 @@ class TextParser:
         if not issues:
             return True
 
-        # Check if text is substantial but we found very few issues
-        text_lines = [line.strip() for line in text.split("\n") if line.strip()]
-        if len(text_lines) > 20 and len(issues) < 3:
-            return True
-
-        # Check if issues are mostly empty (poor parsing quality)
-        empty_issues = 0
-        for issue in issues:
-            if (not issue.description or len(issue.description.strip()) < 10) and (
-                not issue.acceptance_criteria or len(issue.acceptance_criteria) == 0
-            ):
-                empty_issues += 1
+        # Check if issues are mostly empty (poor parsing quality); this is
+        # bounded by the number of issues, so it runs before the line scan
+        empty_issues = sum(
+            1
+            for issue in issues
+            if (not issue.description or len(issue.description.strip()) < 10)
+            and not issue.acceptance_criteria
+        )
 
         # If more than half the issues are empty, use LLM fallback
         if empty_issues > len(issues) / 2:
             return True
 
+        # Check if text is substantial but we found very few issues
+        # (blank lines were already dropped, so this is a plain length check)
+        if len(lines) > 20 and len(issues) < 3:
+            return True
+
         return False
 
     def _parse_with_llm(self, text: str) -> List[JiraIssue]:
         """Use LLM to extract Jira issues from text."""
-        if not self.llm:
+        llm = self._get_llm()
+        if not llm:
             return []
 
         try:
-            from langchain.schema import HumanMessage, SystemMessage
-
-            system_prompt = """You are an expert at extracting Jira issues from text.
-            Given text content, extract all Epics, Stories, and Tasks with their details.
-
-            Return the result as a JSON array of objects with this exact structure:
-            [
-              {
-                "title": "Issue title",
-                "description": "Full description",
-                "issue_type": "Epic|Story|Task",
-                "priority": "Highest|High|Medium|Low|Lowest",
-                "story_key": "optional story key",
-                "acceptance_criteria": ["criterion 1", "criterion 2"],
-                "business_outcome": "optional business outcome",
-                "epic_name": "optional epic name",
-                "parent": "optional parent reference",
-                "dependencies": "optional dependencies",
-                "estimated_effort": "optional effort estimate",
-                "labels": "optional labels"
-              }
-            ]
-
-            Guidelines:
-            - Extract all issues you can find
-            - Use "Story" as default issue type if unclear
-            - Use "Medium" as default priority if unclear
-            - Combine multi-line content appropriately
-            - Extract acceptance criteria as separate items
-            - Be comprehensive but accurate
-            """
-
-            human_message = HumanMessage(
-                content=f"""
-            Please extract all Jira issues from this text:
-
-            {text}
-
-            Return only the JSON array, no other text.
-            """
-            )
-
-            response = self.llm.invoke(
-                [SystemMessage(content=system_prompt), human_message]
-            )
+            cached = self._cached_llm_issues(text)
+            if cached is not None:
+                return cached
+
+            response = llm.invoke(self._llm_messages(text))
 
             # Parse the LLM response
-            return self._parse_llm_response(response.content)
+            issues = self._parse_llm_response(response.content)
 
         except Exception as e:
             print(f"⚠️  LLM parsing failed: {e}")
             return []
 
+        # Outside the try: failing to cache must not discard a good parse
+        self._cache_llm_answer(text, response.content, issues)
+        return issues
+
+    async def _aparse_with_llm(self, text: str) -> List[JiraIssue]:
+        """Use LLM to extract Jira issues from text without blocking."""
+        llm = self._get_llm()
+        if not llm:
+            return []
+
+        try:
+            cached = self._cached_llm_issues(text)
+            if cached is not None:
+                return cached
+
+            response = await llm.ainvoke(self._llm_messages(text))
+            issues = self._parse_llm_response(response.content)
+
+        except Exception as e:
+            print(f"⚠️  LLM parsing failed: {e}")
+            return []
+
+        self._cache_llm_answer(text, response.content, issues)
+        return issues
+
+    def _cached_llm_issues(self, text: str) -> Optional[List[JiraIssue]]:
+        """Issues from an earlier LLM answer for this text, if one is cached."""
+        if self.llm_cache is None:
+            return None
+
+        content = self.llm_cache.get(self.llm_cache.key_for_text(text))
+        if content is None:
+            return None
+
+        print("💾 Using cached LLM fallback result")
+        return self._parse_llm_response(content)
+
+    def _cache_llm_answer(
+        self, text: str, response_content: str, issues: List[JiraIssue]
+    ):
+        """Cache an LLM answer that produced issues; a failed write is ignored."""
+        if not issues or self.llm_cache is None:
+            return
+
+        try:
+            self.llm_cache.set(self.llm_cache.key_for_text(text), response_content)
+        except OSError as e:
+            print(f"⚠️  Could not cache LLM fallback result: {e}")
+
+    def _llm_messages(self, text: str) -> list:
+        """Build the extraction prompt for the fallback LLM."""
+        from langchain.schema import HumanMessage
+
+        human_message = HumanMessage(
+            content=f"""
+        Please extract all Jira issues from this text:
+
+        {text}
+
+        Return only the JSON array, no other text.
+        """
+        )
+
+        return [_system_message(), human_message]
+
     def _parse_llm_response(self, response_content: str) -> List[JiraIssue]:
         """Parse LLM response into JiraIssue objects."""
         try:
@@ -537,13 +756,12 @@ class TextParser:
             content = response_content.strip()
 
             # Remove markdown code blocks if present
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
+            fence_match = _CODE_FENCE_RE.match(content)
+            if fence_match:
+                content = fence_match.group(1)
 
             # Parse JSON
-            issues_data = json.loads(content)
+            issues_data = orjson.loads(content)
 
             if not isinstance(issues_data, list):
                 print("⚠️  LLM response is not a list")
@@ -555,7 +773,8 @@ class TextParser:
                     # Map the LLM response to JiraIssue
                     issue = JiraIssue(
                         title=item.get("title", "Untitled"),
-                        description=item.get("description", ""),
+                        # Descriptions are always text; the model may send null
+                        description=item.get("description") or "",
                         issue_type=self._parse_issue_type(
                             item.get("issue_type", "Story")
                         ),
@@ -579,7 +798,7 @@ class TextParser:
 
             return issues
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"⚠️  Could not parse LLM response as JSON: {e}")
             return []
         except Exception as e:
@@ -588,9 +807,27 @@ class TextParser:
 
     def _parse_issue_type(self, issue_type_str: str) -> IssueType:
         """Parse issue type string into IssueType enum."""
-        issue_type_mapping = {
-            "epic": IssueType.EPIC,
-            "story": IssueType.STORY,
-            "task": IssueType.TASK,
-        }
-        return issue_type_mapping.get(issue_type_str.lower(), IssueType.STORY)
+        return _ISSUE_TYPE_BY_NAME.get(issue_type_str) or _ISSUE_TYPE_BY_NAME.get(
+            issue_type_str.strip().lower(), IssueType.STORY
+        )
+
+
+def _copy_issue(issue: JiraIssue) -> JiraIssue:
+    """Copy an issue, including its mutable acceptance criteria list."""
+    return replace(issue, acceptance_criteria=list(issue.acceptance_criteria))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_file_structured(
+    file_path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], Tuple[JiraIssue, ...]]:
+    """Structured-parse a file once per (path, mtime, size).
+
+    Returns the stripped lines and the issues; see ``TextParser.parse_file``.
+    """
+    parser = TextParser(enable_llm_fallback=False)
+    with open(file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        # Stream the file's lines straight into the parser, so only the
+        # stripped copy of the input is ever held in memory
+        stripped, issues = parser._parse_structured(f)
+    return stripped, tuple(issues)
@@ -34,13 +34,13 @@ def test_imports():
 
     # Test LangChain imports (these might fail if not properly installed)
     try:
-        from langchain_community.tools.jira.tool import JiraAction
+        from langchain.schema import HumanMessage
 
         # Test that we can access the class
-        _ = JiraAction
-        print("  ✅ langchain-community imported successfully")
+        _ = HumanMessage
+        print("  ✅ langchain imported successfully")
     except ImportError as e:
-        print(f"  ⚠️  langchain-community import failed: {e}")
+        print(f"  ⚠️  langchain import failed: {e}")
         print("     This is expected if not installed yet")
 
     try:
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from parser import TextParser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """One structured-only TextParser reused by every test that just parses.
+
+    Each parse starts from fresh state, so sharing it is safe; tests that
+    patch the parser or exercise the LLM fallback build their own.
+    """
+    return TextParser(enable_llm_fallback=False)
@@ -1,18 +1,15 @@
 """Integration tests for the Jira LangChain system."""
 
-import os
-import tempfile
 from unittest.mock import MagicMock, patch
 
-from parser import IssueType, TextParser
+from parser import IssueType
 
 
 class TestIntegration:
     """Integration test cases."""
 
-    def test_sample_file_parsing(self):
-        """Test parsing the sample tickets file."""
-        # Create a sample file for testing
+    def test_sample_file_parsing(self, parser):
+        """Test parsing the sample tickets content."""
         sample_content = """
 epic:
 
@@ -33,52 +30,37 @@ Acceptance Criteria:
 * All data types are properly converted
 """
 
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(sample_content)
-            temp_file = f.name
-
-        try:
-            # Test parsing
-            parser = TextParser(enable_llm_fallback=False)
-            issues = parser.parse_file(temp_file)
-
-            # Verify results - should have 2 epics and 1 story
-            assert len(issues) == 3
-
-            # Find the issues
-            epics = [issue for issue in issues if issue.issue_type == IssueType.EPIC]
-            stories = [issue for issue in issues if issue.issue_type == IssueType.STORY]
-
-            assert len(epics) == 2
-            assert len(stories) == 1
-
-            # Check main epic
-            main_epic = next(
-                (
-                    epic
-                    for epic in epics
-                    if epic.epic_name == "TEST-EPIC - Test Epic Name"
-                ),
-                None,
-            )
-            assert main_epic is not None
-            assert main_epic.title == "TEST-EPIC - Test Epic Name"
-            assert "integration testing" in main_epic.description
-            assert (
-                main_epic.business_outcome
-                == "Validate the parsing and integration workflow"
-            )
-
-            # Check story
-            story = stories[0]
-            assert story.title == "Integration Test Story"
-            assert story.story_key == "TEST-1"
-            assert len(story.acceptance_criteria) == 3
-
-        finally:
-            # Clean up
-            os.unlink(temp_file)
+        # Parse in memory; parse_file itself is covered in test_parser.py
+        issues = parser.parse_text(sample_content)
+
+        # Verify results - should have 2 epics and 1 story
+        assert len(issues) == 3
+
+        # Find the issues
+        epics = [issue for issue in issues if issue.issue_type == IssueType.EPIC]
+        stories = [issue for issue in issues if issue.issue_type == IssueType.STORY]
+
+        assert len(epics) == 2
+        assert len(stories) == 1
+
+        # Check main epic
+        main_epic = next(
+            (epic for epic in epics if epic.epic_name == "TEST-EPIC - Test Epic Name"),
+            None,
+        )
+        assert main_epic is not None
+        assert main_epic.title == "TEST-EPIC - Test Epic Name"
+        assert "integration testing" in main_epic.description
+        assert (
+            main_epic.business_outcome
+            == "Validate the parsing and integration workflow"
+        )
+
+        # Check story
+        story = stories[0]
+        assert story.title == "Integration Test Story"
+        assert story.story_key == "TEST-1"
+        assert len(story.acceptance_criteria) == 3
 
     def test_main_module_imports(self):
         """Test that main modules can be imported successfully."""
@@ -93,27 +75,22 @@ Acceptance Criteria:
         assert IssueType.EPIC == "Epic"
         assert Priority.HIGH == "High"
 
-    @patch.dict(
-        os.environ,
-        {
+    def test_jira_integration_initialization(self, monkeypatch):
+        """Test JiraIntegration initialization with mocked environment."""
+        for name, value in {
             "JIRA_URL": "https://test.atlassian.net",
             "JIRA_USERNAME": "test@example.com",
             "JIRA_API_TOKEN": "test-token",
             "JIRA_PROJECT_KEY": "TEST",
             "LLM_PROVIDER": "anthropic",
             "ANTHROPIC_API_KEY": "test-key",
-        },
-    )
-    def test_jira_integration_initialization(self):
-        """Test JiraIntegration initialization with mocked environment."""
+        }.items():
+            monkeypatch.setenv(name, value)
+
         # Mock the LangChain components to avoid actual API calls
-        with (
-            patch("jira_integration.JiraAction") as mock_jira_action,
-            patch("jira_integration.ChatAnthropic") as mock_chat_anthropic,
-        ):
+        with patch("langchain_anthropic.ChatAnthropic") as mock_chat_anthropic:
 
             # Configure mocks
-            mock_jira_action.return_value = MagicMock()
             mock_chat_anthropic.return_value = MagicMock()
 
             # Test import and initialization
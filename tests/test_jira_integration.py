@@ -0,0 +1,481 @@
+"""Tests for the Jira integration helpers."""
+
+import asyncio
+import os
+import threading
+import warnings
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from jira_integration import JIRA_RATE_LIMIT, MAX_BULK
+from parser import AcceptanceCriteria, IssueType, JiraIssue
+
+
+@pytest.fixture
+def jira():
+    """JiraIntegration with mocked configuration and LangChain components."""
+    env = {
+        "JIRA_URL": "https://test.atlassian.net",
+        "JIRA_USERNAME": "test@example.com",
+        "JIRA_API_TOKEN": "test-token",
+        "JIRA_PROJECT_KEY": "TEST",
+        "LLM_PROVIDER": "anthropic",
+        "ANTHROPIC_API_KEY": "test-key",
+    }
+    with (
+        patch.dict(os.environ, env),
+        patch("langchain_anthropic.ChatAnthropic", return_value=MagicMock()),
+    ):
+        from jira_integration import JiraIntegration
+
+        yield JiraIntegration()
+
+
+class TestBulkCreate:
+    """Test cases for bulk issue creation."""
+
+    def test_map_bulk_response_aligns_failures(self, jira):
+        """Test that failed elements keep their position in the results."""
+        data = {
+            "issues": [{"id": "1", "key": "TEST-1"}, {"id": "3", "key": "TEST-3"}],
+            "errors": [
+                {
+                    "failedElementNumber": 1,
+                    "elementErrors": {"errors": {"summary": "required"}},
+                }
+            ],
+        }
+
+        results = jira._map_bulk_response(data, 3)
+
+        assert results[0]["key"] == "TEST-1"
+        assert results[1]["status"] == "failed"
+        assert results[2]["key"] == "TEST-3"
+
+    def test_build_issue_data_story_with_epic_link(self, jira):
+        """Test that stories get the discovered epic link field."""
+        jira._epic_link_field = "parent"
+        issue = JiraIssue(
+            title="Test Story",
+            description="Test description",
+            issue_type=IssueType.STORY,
+            labels="backend, api",
+        )
+
+        data = jira._build_issue_data(issue, epic_link="TEST-1")
+
+        assert data["issuetype"] == {"name": "Story"}
+        assert data["parent"] == {"key": "TEST-1"}
+        assert data["labels"] == ["backend", "api"]
+
+
+class TestProjectInfo:
+    """Test cases for project lookups over the shared session."""
+
+    def test_list_issue_types_reads_project(self, jira):
+        """Test that issue types come from the project REST resource."""
+        response = MagicMock(
+            content=b'{"name": "Test", "issueTypes": [{"name": "Epic"}]}'
+        )
+        with patch.object(jira._session, "get", return_value=response) as get:
+            assert jira.get_project_info()["name"] == "Test"
+            assert jira.list_issue_types() == [{"name": "Epic"}]
+
+        get.assert_called_with("https://test.atlassian.net/rest/api/2/project/TEST")
+
+    def test_issue_type_ids_used_once_known(self, jira):
+        """Test that issue types are sent by id after the project probe."""
+        issue = JiraIssue(title="Epic", description="", issue_type=IssueType.EPIC)
+        assert jira._build_issue_data(issue)["issuetype"] == {"name": "Epic"}
+
+        response = MagicMock(
+            content=b'{"name": "Test", "issueTypes": '
+            b'[{"id": "10000", "name": "Epic"}, {"id": "10001", "name": "Story"}]}'
+        )
+        with patch.object(jira._session, "get", return_value=response):
+            jira.get_project_info()
+
+        assert jira._build_issue_data(issue)["issuetype"] == {"id": "10000"}
+
+    def test_createmeta_cached_per_instance(self, jira):
+        """Test that create metadata is fetched once and kept on the instance."""
+        response = MagicMock(content=b'{"projects": []}')
+        with patch.object(jira._session, "get", return_value=response) as get:
+            jira._fetch_createmeta("TEST")
+            assert jira._fetch_createmeta("TEST") == {"projects": []}
+
+        assert get.call_count == 1
+        assert jira._createmeta_cache == {"TEST": {"projects": []}}
+
+
+class TestRetryDelay:
+    """Test cases for throttled request backoff."""
+
+    def test_retry_after_header_wins(self, jira):
+        """Test that Retry-After is honoured and capped."""
+        assert jira._retry_delay("3", 0) == 3.0
+        assert jira._retry_delay("3600", 0) == 30
+
+    def test_exponential_backoff_without_header(self, jira):
+        """Test the fallback when Retry-After is missing or unparseable."""
+        assert jira._retry_delay(None, 0) == 0.5
+        assert jira._retry_delay(None, 2) == 2.0
+        assert jira._retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", 1) == 1.0
+
+
+class TestRateLimit:
+    """Test cases for slowing down near Jira's rate limit."""
+
+    def test_near_limit_slows_down_once(self, jira):
+        """Test that repeated warnings don't keep halving the rate."""
+        near = {"X-RateLimit-NearLimit": "true"}
+        jira._start_rate_limit()
+
+        jira._adapt_rate_limit(near)
+        slowed = jira._limiter
+        jira._adapt_rate_limit(near)
+
+        assert jira._limiter is slowed
+        assert slowed.max_rate == JIRA_RATE_LIMIT // 2
+
+    def test_rate_restored_after_cooldown(self, jira):
+        """Test that the configured rate returns once the window has passed."""
+        jira._start_rate_limit()
+        with patch("jira_integration.time.monotonic", return_value=100.0):
+            jira._adapt_rate_limit({"X-RateLimit-NearLimit": "true"})
+        with patch("jira_integration.time.monotonic", return_value=101.0):
+            jira._adapt_rate_limit({})
+        assert jira._limiter.max_rate == JIRA_RATE_LIMIT // 2
+
+        with patch("jira_integration.time.monotonic", return_value=200.0):
+            jira._adapt_rate_limit({})
+        assert jira._limiter.max_rate == JIRA_RATE_LIMIT
+
+    def test_each_batch_gets_its_own_limiter(self, jira):
+        """Test that batches in separate event loops never share a limiter."""
+        limiters = []
+
+        async def fake_batch(session, issues):
+            async with jira._limiter:
+                limiters.append(jira._limiter)
+            jira._adapt_rate_limit({"X-RateLimit-NearLimit": "true"})
+            return []
+
+        jira._create_issues_batch = fake_batch
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            jira.create_issues_batch([])
+            jira.create_issues_batch([])
+
+        assert limiters[0] is not limiters[1]
+        assert limiters[1].max_rate == JIRA_RATE_LIMIT
+
+
+class TestEpicDiscovery:
+    """Test cases for cached epic discovery."""
+
+    def test_discovery_is_cached_until_invalidated(self, jira):
+        """Test that repeated discovery reuses the cached search."""
+        with patch.object(
+            jira, "_search_epic_mappings", return_value={"PREP": "TEST-1"}
+        ) as search:
+            first = jira._discover_epic_mappings()
+            first["KITCH"] = "TEST-2"
+            second = jira._discover_epic_mappings()
+
+            assert search.call_count == 1
+            assert second == {"PREP": "TEST-1"}
+
+            jira.invalidate_epic_cache()
+            jira._discover_epic_mappings()
+
+            assert search.call_count == 2
+
+    def test_prepare_batch_warms_lookups(self, jira):
+        """Test that a prepared batch reuses the epic and Epic Link lookups."""
+        with (
+            patch.object(
+                jira, "_search_epic_mappings", return_value={"PREP": "TEST-1"}
+            ) as search,
+            patch.object(jira, "_get_project_fields", return_value="parent") as meta,
+        ):
+            asyncio.run(jira.aprepare_batch())
+
+            assert jira._discover_epic_mappings() == {"PREP": "TEST-1"}
+            assert jira._get_epic_link_field() == "parent"
+            assert search.call_count == 1
+            assert meta.call_count == 1
+
+    def test_batch_lookups_run_off_the_event_loop(self, jira):
+        """Test that the blocking Jira lookups don't run on the loop's thread."""
+        threads = []
+
+        def lookup():
+            threads.append(threading.get_ident())
+            return {}
+
+        story = JiraIssue(title="Buy", description="Buy", issue_type=IssueType.STORY)
+        with (
+            patch.object(jira, "_discover_epic_mappings", side_effect=lookup),
+            patch.object(jira, "_get_epic_link_field", side_effect=lookup),
+            patch.object(jira, "_abulk_create", AsyncMock(return_value=[{}])),
+        ):
+            jira.create_issues_batch([story])
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+
+class TestDependencyResolution:
+    """Test cases for dependency reference resolution."""
+
+    def test_resolve_dependency_keys(self, jira):
+        """Test exact, partial, fallback and direct-key resolution."""
+        mappings = {
+            "PREP": "TEST-1",
+            "[PREP] Emergency Supply Purchase": "TEST-2",
+            "Deep Clean Kitchen": "TEST-3",
+            "[KITCH] Deep Clean Kitchen": "TEST-4",
+        }
+        dependencies = jira._parse_dependencies(
+            "[KITCH] Deep Clean Kitchen, [PREP] supply, [PREP] Unknown, TEST-9, None"
+        )
+
+        resolved = jira._resolve_dependency_keys(dependencies, mappings)
+
+        assert resolved == ["TEST-3", "TEST-2", "TEST-1", "TEST-9"]
+
+
+class TestCreateIssuesBatch:
+    """Test cases for the end-to-end batch creation flow."""
+
+    def test_batch_creates_epics_before_linked_stories(self, jira):
+        """Test that stories are linked to epics created earlier in the batch."""
+        jira._epic_link_field = "parent"
+        posted = []
+
+        async def fake_post(session, url, payload, retry_statuses=None):
+            posted.append((url, payload))
+            if url.endswith("/issue/bulk"):
+                count = len(payload["issueUpdates"])
+                start = len(posted) * 10
+                issues = [{"key": f"TEST-{start + i}"} for i in range(count)]
+                return 201, {"issues": issues, "errors": []}
+            return 201, {}
+
+        issues = [
+            JiraIssue(
+                title="[PREP] Buy supplies",
+                description="Buy",
+                issue_type=IssueType.STORY,
+                parent="PREP",
+            ),
+            JiraIssue(
+                title="[PREP] Clean",
+                description="Clean",
+                issue_type=IssueType.STORY,
+                parent="PREP",
+                dependencies="[PREP] Buy supplies",
+            ),
+        ]
+
+        with (
+            patch.object(jira, "_discover_epic_mappings", return_value={}),
+            patch.object(jira, "_apost_json", side_effect=fake_post),
+        ):
+            results = jira.create_issues_batch(issues)
+
+        assert [result["key"] for result in results] == [
+            "TEST-10",
+            "TEST-20",
+            "TEST-21",
+        ]
+        story_fields = posted[1][1]["issueUpdates"][0]["fields"]
+        assert story_fields["parent"] == {"key": "TEST-10"}
+        assert posted[2][1]["inwardIssue"] == {"key": "TEST-21"}
+        assert posted[2][1]["outwardIssue"] == {"key": "TEST-20"}
+
+
+class TestTransportErrors:
+    """Test cases for network failures while posting to Jira."""
+
+    @staticmethod
+    def response(body):
+        """An async context manager yielding a 201 response with ``body``."""
+        response = MagicMock(status=201, headers={})
+        response.read = AsyncMock(return_value=body)
+        context = MagicMock()
+        context.__aenter__.return_value = response
+        return context
+
+    def test_unsent_request_is_retried(self, jira):
+        """Test that a failed connection is retried like a throttled call."""
+        session = MagicMock()
+        session.post.side_effect = [
+            aiohttp.ClientConnectorError(MagicMock(), OSError("refused")),
+            self.response(b'{"key": "TEST-1"}'),
+        ]
+
+        jira._start_rate_limit()
+        with patch("jira_integration.RETRY_BACKOFF", 0):
+            result = asyncio.run(jira._apost_json(session, "https://jira/x", {}))
+
+        assert result == (201, {"key": "TEST-1"})
+        assert session.post.call_count == 2
+
+    def test_failed_chunk_keeps_other_results(self, jira):
+        """Test that a dropped connection fails only its own chunk."""
+        session = MagicMock()
+        session.post.side_effect = [
+            self.response(b'{"issues": [{"key": "TEST-1"}], "errors": []}'),
+            aiohttp.ServerDisconnectedError(),
+        ]
+        issues_data = [{"summary": str(i)} for i in range(MAX_BULK + 1)]
+
+        jira._start_rate_limit()
+        results = asyncio.run(jira._abulk_create(session, issues_data))
+
+        assert session.post.call_count == 2
+        assert results[0] == {"key": "TEST-1"}
+        assert results[-1]["status"] == "failed"
+        assert "ServerDisconnectedError" in results[-1]["errors"]
+
+
+class TestEnhancement:
+    """Test cases for LLM enhancement."""
+
+    def test_enhance_many_keeps_order_and_failures(self, jira):
+        """Test that failed enhancements fall back to the original issue."""
+
+        async def fake_ainvoke(messages):
+            if "Broken" in messages[1].content:
+                raise RuntimeError("rate limited")
+            return MagicMock(content="Better")
+
+        jira.llm.ainvoke = fake_ainvoke
+        issues = [
+            JiraIssue(
+                title=title,
+                description="Basic",
+                issue_type=IssueType.STORY,
+                parent="PREP",
+            )
+            for title in ("Good", "Broken")
+        ]
+
+        enhanced = asyncio.run(jira.enhance_many(issues, concurrency=2))
+
+        assert enhanced[0].description.endswith("--- AI Enhanced ---\nBetter")
+        assert enhanced[0].parent == "PREP"
+        assert enhanced[1] is issues[1]
+
+    def test_enhancement_runs_in_separate_loops(self, jira):
+        """Test that each event loop paces LLM calls with its own limiter."""
+        jira.llm.ainvoke = AsyncMock(return_value=MagicMock(content="Better"))
+        issue = JiraIssue(title="Good", description="Basic", issue_type=IssueType.STORY)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            asyncio.run(jira.enhance_many([issue]))
+            asyncio.run(jira.enhance_many([issue]))
+
+        assert jira.llm.ainvoke.await_count == 2
+
+    def test_rate_limited_enhancement_is_retried(self, jira):
+        """Test that a 429 from the provider is retried before giving up."""
+        calls = []
+
+        async def fake_ainvoke(messages):
+            calls.append(messages)
+            if len(calls) < 3:
+                error = RuntimeError("rate limited")
+                error.status_code = 429
+                raise error
+            return MagicMock(content="Better")
+
+        jira.llm.ainvoke = fake_ainvoke
+        issue = JiraIssue(
+            title="Retry", description="Basic", issue_type=IssueType.STORY
+        )
+
+        with patch("jira_integration.RETRY_BACKOFF", 0):
+            enhanced = asyncio.run(jira.aenhance_with_llm(issue))
+
+        assert len(calls) == 3
+        assert enhanced.description.endswith("Better")
+
+
+class TestEpicLinkField:
+    """Test cases for Epic Link field discovery."""
+
+    def test_epic_link_name_beats_parent(self, jira):
+        """Test that a named Epic Link field wins over parent."""
+        fields = {
+            "customfield_10008": {"name": "Epic Name"},
+            "parent": {"name": "Parent"},
+            "customfield_10014": {"name": "Epic Link"},
+        }
+
+        assert jira._find_epic_link_field(fields) == "customfield_10014"
+
+    def test_parent_beats_epic_custom_field(self, jira):
+        """Test the parent and custom-field fallbacks."""
+        fields = {
+            "customfield_10008": {"name": "Epic Name"},
+            "parent": {"name": "Parent"},
+        }
+
+        assert jira._find_epic_link_field(fields) == "parent"
+        del fields["parent"]
+        assert jira._find_epic_link_field(fields) == "customfield_10008"
+        assert jira._find_epic_link_field({"summary": {"name": "Summary"}}) is None
+
+
+class TestFormatDescription:
+    """Test cases for Jira description formatting."""
+
+    def test_format_description_with_all_sections(self, jira):
+        """Test the epic name, outcome and numbered criteria layout."""
+        issue = JiraIssue(
+            title="PREP - Preparation",
+            description="Get ready",
+            issue_type=IssueType.EPIC,
+            epic_name="PREP - Preparation",
+            business_outcome="Clean house",
+            acceptance_criteria=[
+                AcceptanceCriteria("Supplies bought"),
+                AcceptanceCriteria("Rooms cleared"),
+            ],
+        )
+
+        assert jira._format_description(issue) == (
+            "**Epic Name:** PREP - Preparation\n"
+            "\n"
+            "Get ready\n"
+            "\n"
+            "**Business Outcome:** Clean house\n"
+            "\n"
+            "**Acceptance Criteria:**\n"
+            "1. Supplies bought\n"
+            "2. Rooms cleared"
+        )
+
+
+class TestParseLabels:
+    """Test cases for label parsing."""
+
+    def test_parse_labels_cleans_invalid_characters(self, jira):
+        """Test comma and space separated labels with invalid characters."""
+        assert jira._parse_labels("deep clean, kitchen!, -urgent - now-") == [
+            "deep-clean",
+            "kitchen",
+            "urgent-now",
+        ]
+        assert jira._parse_labels("backend  api-v2 #ops") == [
+            "backend",
+            "api-v2",
+            "ops",
+        ]
+        assert jira._parse_labels("") == []
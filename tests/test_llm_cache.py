@@ -0,0 +1,76 @@
+"""Tests for the LLM response cache."""
+
+from unittest.mock import patch
+
+from llm_cache import FileBackend, LLMCache
+from parser import AcceptanceCriteria, IssueType, JiraIssue
+
+
+def make_issue(**overrides):
+    """Build a story with sensible defaults for cache tests."""
+    fields = {
+        "title": "Deep Clean Kitchen",
+        "description": "Scrub everything",
+        "issue_type": IssueType.STORY,
+    }
+    fields.update(overrides)
+    return JiraIssue(**fields)
+
+
+class TestLLMCache:
+    """Test cases for LLMCache."""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        """Test that stored values are returned and counted as hits."""
+        cache = LLMCache(backend=FileBackend(str(tmp_path)))
+        key = LLMCache.key_for(make_issue())
+
+        assert cache.get(key) is None
+        cache.set(key, "Enhanced")
+
+        assert cache.get(key) == "Enhanced"
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_expired_entries_miss(self, tmp_path):
+        """Test that entries older than the TTL are ignored."""
+        cache = LLMCache(backend=FileBackend(str(tmp_path)), ttl_seconds=10)
+        with patch("llm_cache.time.time", return_value=1000):
+            cache.set("key", "Enhanced")
+        with patch("llm_cache.time.time", return_value=1011):
+            assert cache.get("key") is None
+
+    def test_key_tracks_prompt_fields(self):
+        """Test that the key changes with any field sent to the LLM."""
+        key = LLMCache.key_for(make_issue())
+
+        assert key == LLMCache.key_for(make_issue(priority=None))
+        assert key != LLMCache.key_for(make_issue(description="Other"))
+        assert key != LLMCache.key_for(
+            make_issue(acceptance_criteria=[AcceptanceCriteria("Shiny")])
+        )
+
+    def test_text_key_ignores_whitespace_layout(self):
+        """Test that re-wrapped or re-indented parser input shares a key."""
+        key = LLMCache.key_for_text("Buy supplies\nfor the kitchen")
+
+        assert key == LLMCache.key_for_text("  Buy supplies for\r\nthe kitchen\n")
+        assert key != LLMCache.key_for_text("Buy supplies for the garage")
+        assert key != LLMCache.key_for(make_issue(title="Buy supplies"))
+
+    def test_failed_write_is_not_fatal(self, tmp_path):
+        """Test that an unwritable cache directory only loses the entry."""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("", encoding="utf-8")
+        cache = LLMCache(backend=FileBackend(str(blocker / "llm")))
+
+        cache.set("key", "Enhanced")
+
+        assert cache.get("key") is None
+
+    def test_write_leaves_no_temporary_files(self, tmp_path):
+        """Test that only the entry itself remains after a write."""
+        cache = LLMCache(backend=FileBackend(str(tmp_path)))
+
+        cache.set("key", "Enhanced")
+
+        assert [path.name for path in tmp_path.iterdir()] == ["key.json"]
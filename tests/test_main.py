@@ -0,0 +1,112 @@
+"""Tests for the command-line entry point."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import main
+from main import check_connection, configure_logging, display_issues, flush_logging
+from parser import AcceptanceCriteria, IssueType, JiraIssue
+
+
+class TestDisplayIssues:
+    """Test cases for the parsed-issue preview."""
+
+    def test_display_issues_layout(self, capsys):
+        """Test that every populated field is shown in order."""
+        issues = [
+            JiraIssue(
+                title="[PREP] Buy supplies",
+                description="x" * 120,
+                issue_type=IssueType.STORY,
+                parent="PREP",
+                labels="shopping",
+                acceptance_criteria=[AcceptanceCriteria("Bought")],
+            )
+        ]
+
+        display_issues(issues)
+
+        assert capsys.readouterr().out == (
+            "\n📋 Parsed Issues:\n" + "=" * 50 + "\n\n1. Story: [PREP] Buy supplies\n"
+            "   Priority: Medium\n"
+            "   Parent Epic: PREP\n"
+            "   Labels: shopping\n"
+            f"   Description: {'x' * 100}...\n"
+            "   Acceptance Criteria: 1 items\n"
+        )
+
+
+class TestCheckConnection:
+    """Test cases for the cached Jira connection check."""
+
+    def make_jira(self):
+        jira = MagicMock(jira_url="https://test.atlassian.net", project_key="TEST")
+        jira.get_project_info.return_value = {
+            "name": "Test Project",
+            "issueTypes": [{"id": "10000", "name": "Epic", "iconUrl": "x"}],
+        }
+        return jira
+
+    def test_recent_check_is_reused(self, tmp_path):
+        """Test that a second check within the TTL skips the probe."""
+        jira = self.make_jira()
+        with patch("main.PROJECT_CACHE_FILE", str(tmp_path / "project.json")):
+            check_connection(jira)
+            assert check_connection(jira) == {
+                "name": "Test Project",
+                "issueTypes": [{"id": "10000", "name": "Epic"}],
+            }
+            assert jira.get_project_info.call_count == 1
+            jira.remember_issue_types.assert_called_with(
+                [{"id": "10000", "name": "Epic"}]
+            )
+
+            check_connection(jira, refresh=True)
+            assert jira.get_project_info.call_count == 2
+
+    def test_cache_is_per_project(self, tmp_path):
+        """Test that a cached check for another project is ignored."""
+        jira = self.make_jira()
+        with patch("main.PROJECT_CACHE_FILE", str(tmp_path / "project.json")):
+            check_connection(jira)
+            jira.project_key = "OTHER"
+            check_connection(jira)
+
+        assert jira.get_project_info.call_count == 2
+
+    def test_cache_that_is_not_an_object_is_a_miss(self, tmp_path):
+        """Test that a corrupt cache falls back to probing Jira."""
+        cache_file = tmp_path / "project.json"
+        jira = self.make_jira()
+        with patch("main.PROJECT_CACHE_FILE", str(cache_file)):
+            for content in ("[]", "null", '"x"'):
+                cache_file.write_text(content, encoding="utf-8")
+                assert check_connection(jira)["name"] == "Test Project"
+
+        assert jira.get_project_info.call_count == 3
+
+
+class TestConfigureLogging:
+    """Test cases for the queued log output."""
+
+    def test_repeated_configuration_adds_one_handler(self, capsys):
+        """Test that calling configure_logging twice doesn't duplicate output."""
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        level = root.level
+        jira_level = logging.getLogger("jira_integration").level
+
+        with patch("main._log_listener", None), patch("main.atexit.register"):
+            try:
+                configure_logging(False)
+                configure_logging(True)
+                assert len(root.handlers) == len(handlers) + 1
+
+                logging.getLogger("jira_integration").info("hello")
+                flush_logging()
+                assert capsys.readouterr().out == "hello\n"
+            finally:
+                main._log_listener.stop()
+                root.handlers[:] = handlers
+                root.setLevel(level)
+                logging.getLogger("jira_integration").setLevel(jira_level)
@@ -1,12 +1,16 @@
 """Tests for the text parser module."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from llm_cache import FileBackend, LLMCache
 from parser import AcceptanceCriteria, IssueType, JiraIssue, Priority, TextParser
 
 
 class TestTextParser:
     """Test cases for the TextParser class."""
 
-    def test_parse_epic(self):
+    def test_parse_epic(self, parser):
         """Test parsing a simple epic."""
         sample_text = """
 epic:
@@ -17,7 +21,6 @@ Description: This is a test epic description
 Business Outcome: Test business outcome
 Priority: High
 """
-        parser = TextParser()
         issues = parser.parse_text(sample_text)
 
         assert len(issues) == 1
@@ -28,7 +31,7 @@ Priority: High
         assert epic.business_outcome == "Test business outcome"
         assert epic.priority == Priority.HIGH
 
-    def test_parse_story(self):
+    def test_parse_story(self, parser):
         """Test parsing a user story."""
         sample_text = """
 Epic 1: Test Epic - User Stories
@@ -40,7 +43,6 @@ Acceptance Criteria:
 * Test criterion 1
 * Test criterion 2
 """
-        parser = TextParser(enable_llm_fallback=False)
         issues = parser.parse_text(sample_text)
 
         # Should parse both the epic and the story
@@ -68,7 +70,78 @@ Acceptance Criteria:
             == "As a user I want to test the system So that I can verify it works"
         )
 
-    def test_parse_multiple_issues(self):
+    def test_parse_file_matches_parse_text(self, tmp_path, parser):
+        """Test that reading a file line by line parses like the whole text."""
+        sample_text = (
+            "Story: [PREP] Buy supplies\r\n"
+            "Parent: PREP\r\n"
+            "As a cleaner I want supplies\r\n"
+            "Acceptance Criteria:\r\n"
+            "Supplies bought\r\n"
+            "Priority: High\r\n"
+            "Labels: shopping"
+        )
+        sample_file = tmp_path / "tickets.txt"
+        sample_file.write_bytes(sample_text.encode("utf-8"))
+
+        from_file = parser.parse_file(str(sample_file))
+        from_text = parser.parse_text(sample_text.replace("\r\n", "\n"))
+
+        assert from_file == from_text
+        assert from_file[0].parent == "PREP"
+        assert from_file[0].labels == "shopping"
+
+    def test_parse_file_cached_until_file_changes(self, tmp_path):
+        """Test that an unchanged file is not re-read and an edit invalidates."""
+        sample_file = tmp_path / "tickets.txt"
+        sample_file.write_text("Story: [PREP] Buy supplies\n", encoding="utf-8")
+        parser = TextParser(enable_llm_fallback=False)
+
+        with patch.object(
+            TextParser, "_parse_structured", autospec=True, return_value=((), [])
+        ) as parse:
+            parser.parse_file(str(sample_file))
+            parser.parse_file(str(sample_file))
+            assert parse.call_count == 1
+
+            sample_file.write_text("Story: [PREP] Buy more\n", encoding="utf-8")
+            parser.parse_file(str(sample_file))
+            assert parse.call_count == 2
+
+    def test_cached_parse_file_results_are_not_shared(self, tmp_path, parser):
+        """Test that changing one parse_file result leaves later ones intact."""
+        sample_file = tmp_path / "tickets.txt"
+        sample_file.write_text(
+            "Story: [PREP] Buy supplies\nAcceptance Criteria:\nSupplies bought\n",
+            encoding="utf-8",
+        )
+
+        first = parser.parse_file(str(sample_file))
+        first[0].title = "Changed"
+        first[0].acceptance_criteria.append(AcceptanceCriteria("Extra"))
+        second = TextParser(enable_llm_fallback=False).parse_file(str(sample_file))
+
+        assert second[0].title == "[PREP] Buy supplies"
+        assert second[0].acceptance_criteria == [AcceptanceCriteria("Supplies bought")]
+
+    def test_parse_file_fallback_runs_per_call(self, tmp_path):
+        """Test that a failed LLM fallback is retried on the next parse."""
+        sample_file = tmp_path / "notes.txt"
+        sample_file.write_text("just some notes\n", encoding="utf-8")
+        llm = MagicMock()
+        llm.invoke.side_effect = [
+            RuntimeError("timed out"),
+            MagicMock(content='[{"title": "Buy supplies"}]'),
+        ]
+        parser = TextParser()
+
+        with patch.object(parser, "_get_llm", return_value=llm):
+            assert parser.parse_file(str(sample_file)) == []
+            issues = parser.parse_file(str(sample_file))
+
+        assert [issue.title for issue in issues] == ["Buy supplies"]
+
+    def test_parse_multiple_issues(self, parser):
         """Test parsing multiple issues."""
         sample_text = """
 epic:
@@ -88,7 +161,6 @@ Acceptance Criteria:
 * Test criterion 1
 * Test criterion 2
 """
-        parser = TextParser(enable_llm_fallback=False)
         issues = parser.parse_text(sample_text)
 
         assert len(issues) == 3
@@ -115,17 +187,127 @@ Acceptance Criteria:
         assert story.story_key == "TEST-1"
         assert len(story.acceptance_criteria) == 2
 
-    def test_parse_empty_text(self):
+    def test_parse_empty_text(self, parser):
         """Test parsing empty text."""
-        parser = TextParser()
         issues = parser.parse_text("")
 
         assert len(issues) == 0
 
-    def test_priority_parsing(self):
-        """Test priority parsing."""
+    def test_blank_text_skips_llm_fallback(self):
+        """Test that whitespace-only input never reaches the fallback LLM."""
         parser = TextParser()
 
+        with patch.object(parser, "_get_llm") as get_llm:
+            assert parser.parse_text(" \n\t\n") == []
+
+        get_llm.assert_not_called()
+
+    def test_blank_file_skips_llm_fallback(self, tmp_path):
+        """Test that an empty or whitespace-only file never reaches the LLM."""
+        llm = MagicMock()
+        parser = TextParser()
+
+        for index, content in enumerate(("", " \n\t\n")):
+            blank_file = tmp_path / f"blank{index}.txt"
+            blank_file.write_text(content, encoding="utf-8")
+            with patch.object(parser, "_get_llm", return_value=llm):
+                assert parser.parse_file(str(blank_file)) == []
+            assert parser.issues == []
+
+        llm.invoke.assert_not_called()
+
+    def test_llm_response_null_description(self, parser):
+        """Test that a null description from the LLM becomes empty text."""
+        issues = parser._parse_llm_response(
+            '[{"title": "Buy supplies", "description": null, "issue_type": "Task"}]'
+        )
+
+        assert len(issues) == 1
+        assert issues[0].description == ""
+        assert issues[0].issue_type == IssueType.TASK
+
+    def test_llm_response_in_code_fence(self, parser):
+        """Test that a fenced JSON answer with trailing prose is unwrapped."""
+        issues = parser._parse_llm_response(
+            '```json\n[{"title": "Buy supplies", "priority": "High"}]\n```\n'
+            "Let me know if you need anything else."
+        )
+
+        assert [issue.title for issue in issues] == ["Buy supplies"]
+        assert issues[0].priority == Priority.HIGH
+
+    def test_llm_created_only_when_fallback_needed(self):
+        """Test that the fallback LLM is initialized lazily."""
+        parser = TextParser()
+        complete = (
+            "Story: [PREP] Buy\n"
+            "As a cleaner I want supplies\n"
+            "Acceptance Criteria:\n"
+            "Supplies bought\n"
+        )
+
+        with patch.object(parser, "_initialize_llm", return_value=None) as init:
+            parser.parse_text(complete)
+            assert init.call_count == 0
+
+            parser.parse_text("just some notes")
+            parser.parse_text("more notes")
+            assert init.call_count == 1
+
+    def test_aparse_text_awaits_llm_fallback(self):
+        """Test that concurrent async parses each await the fallback LLM."""
+        parser = TextParser()
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(
+            return_value=MagicMock(content='[{"title": "Buy supplies"}]')
+        )
+
+        async def parse_both():
+            return await asyncio.gather(
+                parser.aparse_text("buy supplies"), parser.aparse_text("clean up")
+            )
+
+        with patch.object(parser, "_get_llm", return_value=llm):
+            results = asyncio.run(parse_both())
+
+        assert [[issue.title for issue in issues] for issues in results] == [
+            ["Buy supplies"],
+            ["Buy supplies"],
+        ]
+        assert llm.ainvoke.await_count == 2
+        llm.invoke.assert_not_called()
+
+    def test_llm_fallback_answer_is_cached(self, tmp_path):
+        """Test that a cached fallback answer is reused instead of the LLM."""
+        cache = LLMCache(backend=FileBackend(str(tmp_path)))
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content='[{"title": "Buy supplies"}]')
+
+        for _ in range(2):
+            parser = TextParser(llm_cache=cache)
+            with patch.object(parser, "_get_llm", return_value=llm):
+                issues = parser.parse_text("buy supplies")
+            assert [issue.title for issue in issues] == ["Buy supplies"]
+
+        assert llm.invoke.call_count == 1
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_cache_write_failure_keeps_llm_result(self):
+        """Test that a failed cache write doesn't discard the LLM's issues."""
+        cache = MagicMock()
+        cache.get.return_value = None
+        cache.set.side_effect = OSError("read-only file system")
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content='[{"title": "Buy supplies"}]')
+        parser = TextParser(llm_cache=cache)
+
+        with patch.object(parser, "_get_llm", return_value=llm):
+            issues = parser.parse_text("buy supplies")
+
+        assert [issue.title for issue in issues] == ["Buy supplies"]
+
+    def test_priority_parsing(self, parser):
+        """Test priority parsing."""
         # Test various priority formats
         assert parser._parse_priority("Highest") == Priority.HIGHEST
         assert parser._parse_priority("highest") == Priority.HIGHEST
@@ -133,6 +315,7 @@ Acceptance Criteria:
         assert parser._parse_priority("Medium") == Priority.MEDIUM
         assert parser._parse_priority("Low") == Priority.LOW
         assert parser._parse_priority("Lowest") == Priority.LOWEST
+        assert parser._parse_priority(" high ") == Priority.HIGH
         assert parser._parse_priority("Invalid") == Priority.MEDIUM
 
 
@@ -0,0 +1,71 @@
+"""Tests for the configuration validator."""
+
+import os
+from unittest.mock import patch
+
+from validate_config import ConfigValidator
+
+VALID_CONFIG = (
+    "JIRA_URL=https://test.atlassian.net\n"
+    "JIRA_USERNAME=test@example.com\n"
+    "JIRA_API_TOKEN=test-token\n"
+    "JIRA_PROJECT_KEY=TEST\n"
+    "LLM_PROVIDER=anthropic\n"
+    "ANTHROPIC_API_KEY=sk-test\n"
+)
+
+
+class TestConfigValidator:
+    """Test cases for configuration validation."""
+
+    def test_valid_config(self, tmp_path):
+        """Test that a complete config validates without errors."""
+        config_file = tmp_path / ".env"
+        config_file.write_text(VALID_CONFIG, encoding="utf-8")
+
+        with patch.dict(os.environ, {}, clear=True):
+            success, errors, warnings = ConfigValidator(str(config_file)).validate()
+
+        assert success
+        assert errors == []
+        assert warnings == []
+
+    def test_missing_config_file(self, tmp_path):
+        """Test that a missing file is reported without raising."""
+        missing = str(tmp_path / ".env")
+
+        success, errors, _ = ConfigValidator(missing).validate()
+
+        assert not success
+        assert errors == [f"Configuration file '{missing}' not found"]
+
+    def test_each_validation_loads_the_config(self, tmp_path):
+        """Test that repeated validation populates the environment every time."""
+        config_file = tmp_path / ".env"
+        config_file.write_text(VALID_CONFIG, encoding="utf-8")
+
+        with patch.dict(os.environ, {}, clear=True):
+            ConfigValidator(str(config_file)).validate()
+
+            # Callers rely on validate() leaving the config in os.environ
+            os.environ.clear()
+            success, errors, _ = ConfigValidator(str(config_file)).validate()
+            assert os.environ["JIRA_PROJECT_KEY"] == "TEST"
+
+        assert success
+        assert errors == []
+
+    def test_environment_overrides_are_validated(self, tmp_path):
+        """Test that variables already set take part in the result."""
+        config_file = tmp_path / ".env"
+        config_file.write_text(VALID_CONFIG, encoding="utf-8")
+
+        with patch.dict(os.environ, {}, clear=True):
+            ConfigValidator(str(config_file)).validate()
+
+            # load_dotenv never overrides variables that are already set
+            os.environ["JIRA_PROJECT_KEY"] = "test"
+            success, _, warnings = ConfigValidator(str(config_file)).validate()
+
+        assert success
+        assert warnings == ["JIRA_PROJECT_KEY should typically be uppercase"]
@@ -4,11 +4,24 @@ Configuration validator for Jira LangChain integration
 """
 
 import os
-from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from dotenv import load_dotenv
 
+# Every environment variable the validator reads
+_CONFIG_FIELDS = (
+    "JIRA_URL",
+    "JIRA_USERNAME",
+    "JIRA_API_TOKEN",
+    "JIRA_PROJECT_KEY",
+    "LLM_PROVIDER",
+    "ANTHROPIC_API_KEY",
+    "GOOGLE_API_KEY",
+    "DEFAULT_EPIC_TYPE",
+    "DEFAULT_STORY_TYPE",
+    "DEFAULT_TASK_TYPE",
+)
+
 
 class ConfigValidator:
     """Validates configuration for Jira LangChain integration."""
@@ -20,27 +33,36 @@ class ConfigValidator:
 
     def validate(self) -> Tuple[bool, List[str], List[str]]:
         """Validate configuration and return success status with errors/warnings."""
+        self.errors = []
+        self.warnings = []
 
-        # Check if config file exists
-        if not Path(self.config_file).exists():
+        # Open the config file once; a missing file is the "not found" case,
+        # and the open file is what gets parsed
+        try:
+            config = open(self.config_file, encoding="utf-8")
+        except FileNotFoundError:
             self.errors.append(f"Configuration file '{self.config_file}' not found")
             return False, self.errors, self.warnings
 
-        # Load environment variables
-        load_dotenv(self.config_file)
+        # Load environment variables, then read them all once
+        with config:
+            load_dotenv(stream=config)
+
+        env = {name: os.environ[name] for name in _CONFIG_FIELDS if name in os.environ}
 
         # Validate Jira configuration
-        self._validate_jira_config()
+        self._validate_jira_config(env)
 
         # Validate LLM configuration
-        self._validate_llm_config()
+        self._validate_llm_config(env)
 
         # Check for optional configurations
-        self._check_optional_config()
+        self._check_optional_config(env)
 
-        return len(self.errors) == 0, self.errors, self.warnings
+        success = len(self.errors) == 0
+        return success, self.errors, self.warnings
 
-    def _validate_jira_config(self):
+    def _validate_jira_config(self, env: Dict[str, str]):
         """Validate Jira-specific configuration."""
 
         # Required Jira fields
@@ -52,7 +74,7 @@ class ConfigValidator:
         }
 
         for field, description in required_fields.items():
-            value = os.getenv(field)
+            value = env.get(field)
             if not value:
                 self.errors.append(f"Missing required field: {field} ({description})")
             elif field == "JIRA_URL":
@@ -60,10 +82,10 @@ class ConfigValidator:
             elif field == "JIRA_PROJECT_KEY":
                 self._validate_project_key(value)
 
-    def _validate_llm_config(self):
+    def _validate_llm_config(self, env: Dict[str, str]):
         """Validate LLM-specific configuration."""
 
-        provider = os.getenv("LLM_PROVIDER", "anthropic").lower()
+        provider = env.get("LLM_PROVIDER", "anthropic").lower()
 
         if provider not in ["anthropic", "google"]:
             self.errors.append(
@@ -73,7 +95,7 @@ class ConfigValidator:
 
         # Check for appropriate API key
         if provider == "anthropic":
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+            api_key = env.get("ANTHROPIC_API_KEY")
             if not api_key:
                 self.errors.append(
                     "ANTHROPIC_API_KEY required when LLM_PROVIDER is 'anthropic'"
@@ -82,7 +104,7 @@ class ConfigValidator:
                 self.warnings.append("ANTHROPIC_API_KEY should start with 'sk-'")
 
         elif provider == "google":
-            api_key = os.getenv("GOOGLE_API_KEY")
+            api_key = env.get("GOOGLE_API_KEY")
             if not api_key:
                 self.errors.append(
                     "GOOGLE_API_KEY required when LLM_PROVIDER is 'google'"
@@ -111,7 +133,7 @@ class ConfigValidator:
                 "JIRA_PROJECT_KEY should contain only letters, numbers, and hyphens"
             )
 
-    def _check_optional_config(self):
+    def _check_optional_config(self, env: Dict[str, str]):
         """Check optional configuration settings."""
 
         # Check issue types
@@ -122,7 +144,7 @@ class ConfigValidator:
         }
 
         for field, default_value in default_types.items():
-            value = os.getenv(field)
+            value = env.get(field)
             if value and value != default_value:
                 self.warnings.append(
                     f"Non-standard {field}: '{value}' (default: '{default_value}')"